@@ -1,6 +1,7 @@
 import puppeteer from 'puppeteer';
 import fs from 'fs/promises';
 import path from 'path';
+import readline from 'readline';
 import { fileURLToPath } from 'url';
 import { parse } from 'csv-parse/sync';
 import slugify from 'slugify';
@@ -10,6 +11,8 @@ const __dirname = path.dirname(__filename);
 
 const DEFAULT_INPUT = path.resolve(__dirname, '../urls.csv');
 const DEFAULT_OUTPUT = path.resolve(__dirname, '../web-scraper-python/output/screenshots');
+const USER_AGENT =
+  'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36';
 
 const parseArgs = () => {
   const args = process.argv.slice(2);
@@ -47,25 +50,19 @@ const readInputCsv = async (filePath) => {
     .filter((record) => record.url);
 };
 
-const captureProductScreenshots = async ({ inputPath, outputDir, viewport }) => {
-  const rows = await readInputCsv(inputPath);
-  if (!rows.length) {
-    console.warn('No URLs found in input file:', inputPath);
-    return;
-  }
-
-  await ensureDirectory(outputDir);
-
-  const browser = await puppeteer.launch({
+const launchBrowser = (viewport) =>
+  puppeteer.launch({
     headless: true,
     defaultViewport: viewport,
   });
 
+const captureRows = async (browser, rows, outputDir) => {
+  await ensureDirectory(outputDir);
+
   const page = await browser.newPage();
-  await page.setUserAgent(
-    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
-  );
+  await page.setUserAgent(USER_AGENT);
 
+  const saved = [];
   for (const row of rows) {
     const slug = slugify(row.store || row.url, { lower: true, strict: true });
     const mainScreenshotPath = path.join(outputDir, `${slug}-full.png`);
@@ -77,10 +74,12 @@ const captureProductScreenshots = async ({ inputPath, outputDir, viewport }) =>
       await new Promise((resolve) => setTimeout(resolve, 2000));
 
       await page.screenshot({ path: mainScreenshotPath, fullPage: true });
+      saved.push(mainScreenshotPath);
 
       const detailSection = await page.$('#prdDetail, #prdDetailContentLazy, .productDetail, .prdDetail');
       if (detailSection) {
         await detailSection.screenshot({ path: detailScreenshotPath });
+        saved.push(detailScreenshotPath);
       } else {
         console.warn(`Detail section not found for ${row.url}`);
       }
@@ -91,7 +90,62 @@ const captureProductScreenshots = async ({ inputPath, outputDir, viewport }) =>
     }
   }
 
-  await browser.close();
+  await page.close();
+  return saved;
+};
+
+const captureProductScreenshots = async ({ inputPath, outputDir, viewport }) => {
+  const rows = await readInputCsv(inputPath);
+  if (!rows.length) {
+    console.warn('No URLs found in input file:', inputPath);
+    return;
+  }
+
+  const browser = await launchBrowser(viewport);
+  try {
+    await captureRows(browser, rows, outputDir);
+  } finally {
+    await browser.close();
+  }
+};
+
+// Daemon mode keeps one browser running and serves capture requests from stdin, one JSON
+// object per line: {"input": "<csv path>", "output": "<dir>"} or {"cmd": "exit"}. Each
+// request is answered with one JSON line on stdout, {"paths": [...]} or {"error": "..."};
+// progress messages go to stderr so stdout carries only responses.
+const runDaemon = async ({ viewport }) => {
+  console.log = console.error;
+
+  const browser = await launchBrowser(viewport);
+  const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+  try {
+    for await (const line of lines) {
+      if (!line.trim()) {
+        continue;
+      }
+
+      let response;
+      try {
+        const request = JSON.parse(line);
+        if (request.cmd === 'exit') {
+          break;
+        }
+        const inputPath = path.resolve(request.input || DEFAULT_INPUT);
+        const outputDir = path.resolve(request.output || DEFAULT_OUTPUT);
+        const rows = await readInputCsv(inputPath);
+        if (!rows.length) {
+          console.warn('No URLs found in input file:', inputPath);
+        }
+        response = { paths: rows.length ? await captureRows(browser, rows, outputDir) : [] };
+      } catch (error) {
+        response = { error: error.message };
+      }
+      process.stdout.write(`${JSON.stringify(response)}\n`);
+    }
+  } finally {
+    lines.close();
+    await browser.close();
+  }
 };
 
 const main = async () => {
@@ -103,6 +157,11 @@ const main = async () => {
     height: Number.parseInt(args.height, 10) || 720,
   };
 
+  if (args.daemon) {
+    await runDaemon({ viewport });
+    return;
+  }
+
   await captureProductScreenshots({ inputPath, outputDir, viewport });
 };
 
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+import codecs
 import csv
+import functools
+import io
+import mimetypes
+import os
 import secrets
+import tempfile
 import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional, Tuple
 
 from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile, status
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 
 from config import Settings, load_settings
 
@@ -20,6 +34,9 @@ from .storage import RunStore, RunStatus
 
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 UPLOAD_DIR_NAME = "ui_uploads"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+PREVIEW_READ_BUFFER = 64 * 1024
 
 
 security = HTTPBasic(auto_error=False)
@@ -34,11 +51,23 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
 
     manager = configure_manager(settings, store_factory)
 
-    app = FastAPI(title="Cafe24 Scraper UI", version="0.1.0")
+    app = FastAPI(title="Cafe24 Scraper UI", version="0.1.0", default_response_class=ORJSONResponse)
     app.state.settings = settings
     app.state.manager = manager
     app.state.templates = templates
 
+    @app.middleware("http")
+    async def _limit_upload_size(request: Request, call_next):
+        # reject oversized uploads before the multipart body is read and spooled
+        if request.method == "POST" and request.url.path == "/runs":
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > settings.ui_max_upload_bytes:
+                return ORJSONResponse(
+                    {"detail": "Upload too large"},
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                )
+        return await call_next(request)
+
     @app.on_event("shutdown")
     async def _shutdown() -> None:
         manager.shutdown()
@@ -61,17 +90,21 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         if not username or not password:
             return None
         if credentials is None:
+            # compare against the stored values anyway so a missing header costs the same as a wrong one
+            secrets.compare_digest(username.encode("utf-8"), username.encode("utf-8"))
+            secrets.compare_digest(password.encode("utf-8"), password.encode("utf-8"))
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication required")
-        if not secrets.compare_digest(credentials.username, username) or not secrets.compare_digest(
-            credentials.password, password
-        ):
+        # evaluate both comparisons without short-circuiting to avoid leaking which one failed
+        username_ok = secrets.compare_digest(credentials.username.encode("utf-8"), username.encode("utf-8"))
+        password_ok = secrets.compare_digest(credentials.password.encode("utf-8"), password.encode("utf-8"))
+        if not (username_ok & password_ok):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
         return credentials
 
     def require_auth(credentials: Optional[HTTPBasicCredentials] = Depends(_authenticate)) -> None:
         return None
 
-    @app.get("/healthz", response_class=JSONResponse)
+    @app.get("/healthz", response_class=ORJSONResponse)
     async def healthcheck() -> dict:
         return {"status": "ok"}
 
@@ -82,7 +115,7 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         store: RunStore = Depends(get_store),
         auth=Depends(require_auth),
     ) -> HTMLResponse:
-        runs = list(store.list_runs())
+        runs = store.list_runs_summary()
         default_input = settings.input_urls_path
         return templates.TemplateResponse(
             "index.html",
@@ -117,19 +150,21 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
             upload_dir.mkdir(parents=True, exist_ok=True)
             dest_name = f"{uuid.uuid4().hex}_{upload.filename}"
             dest_path = upload_dir / dest_name
-            contents = await upload.read()
-            dest_path.write_bytes(contents)
+            try:
+                await run_in_threadpool(_save_upload, upload.file, dest_path, settings.ui_max_upload_bytes)
+            except ValueError as exc:
+                raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)) from exc
             input_path = dest_path
             source = "upload"
 
         run_id = await manager.enqueue_run(input_path=input_path, source=source)
         return RedirectResponse(url=f"/?triggered={run_id}", status_code=status.HTTP_303_SEE_OTHER)
 
-    @app.get("/runs", response_class=JSONResponse)
+    @app.get("/runs", response_class=ORJSONResponse)
     async def list_runs(store: RunStore = Depends(get_store), auth=Depends(require_auth)) -> list[dict]:
-        return [run.to_dict() for run in store.list_runs()]
+        return store.list_runs_summary()
 
-    @app.get("/runs/{run_id}", response_class=JSONResponse)
+    @app.get("/runs/{run_id}", response_class=ORJSONResponse)
     async def get_run(run_id: str, store: RunStore = Depends(get_store), auth=Depends(require_auth)) -> dict:
         record = store.get_run(run_id)
         if not record:
@@ -137,7 +172,12 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         return record.to_dict()
 
     @app.get("/runs/{run_id}/download")
-    async def download_run(run_id: str, store: RunStore = Depends(get_store), auth=Depends(require_auth)):
+    async def download_run(
+        run_id: str,
+        request: Request,
+        store: RunStore = Depends(get_store),
+        auth=Depends(require_auth),
+    ):
         record = store.get_run(run_id)
         if not record:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found")
@@ -146,9 +186,9 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         archive_path = Path(record.archive_path)
         if not archive_path.exists():
             raise HTTPException(status_code=status.HTTP_410_GONE, detail="Archive no longer exists")
-        return FileResponse(archive_path, filename=archive_path.name)
+        return _ranged_file_response(request, archive_path, filename=archive_path.name)
 
-    @app.get("/runs/{run_id}/preview", response_class=JSONResponse)
+    @app.get("/runs/{run_id}/preview", response_class=ORJSONResponse)
     async def preview_run(
         run_id: str,
         limit: int = 3,
@@ -168,11 +208,16 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         if not csv_path.exists():
             raise HTTPException(status_code=status.HTTP_410_GONE, detail="Run CSV no longer exists")
 
-        previews = _load_preview_rows(csv_path, limit)
+        previews = _cached_preview_rows(csv_path, limit)
         return {"run_id": run_id, "records": previews, "total": len(previews)}
 
     @app.get("/runs/{run_id}/log")
-    async def download_log(run_id: str, store: RunStore = Depends(get_store), auth=Depends(require_auth)):
+    async def download_log(
+        run_id: str,
+        request: Request,
+        store: RunStore = Depends(get_store),
+        auth=Depends(require_auth),
+    ):
         record = store.get_run(run_id)
         if not record:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found")
@@ -181,7 +226,7 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         log_path = Path(record.log_path)
         if not log_path.exists():
             raise HTTPException(status_code=status.HTTP_410_GONE, detail="Log file removed")
-        return FileResponse(log_path, filename=log_path.name, media_type="text/plain")
+        return _ranged_file_response(request, log_path, filename=log_path.name, media_type="text/plain")
 
     return app
 
@@ -189,23 +234,211 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
 app = create_app()
 
 
+def _ranged_file_response(
+    request: Request,
+    path: Path,
+    *,
+    filename: str,
+    media_type: Optional[str] = None,
+) -> Response:
+    """Serve a file, honouring a single ``Range: bytes=...`` request header (RFC 7233)."""
+
+    media_type = media_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    file_size = path.stat().st_size
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+
+    range_header = request.headers.get("range")
+    if not range_header:
+        return FileResponse(path, filename=filename, media_type=media_type, headers={"Accept-Ranges": "bytes"})
+
+    try:
+        byte_range = _parse_range(range_header, file_size)
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+    if byte_range is None:
+        return FileResponse(path, filename=filename, media_type=media_type, headers={"Accept-Ranges": "bytes"})
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _iter_file_range(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _parse_range(header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """Return the inclusive ``(start, end)`` offsets requested by a Range header.
+
+    ``None`` means the header should be ignored and the full file served (unknown unit,
+    multiple ranges or malformed syntax); ``ValueError`` means the range is unsatisfiable.
+    """
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        first = int(start_str) if start_str else None
+        last = int(end_str) if end_str else None
+    except ValueError:
+        return None
+
+    if first is None:
+        if last is None:
+            return None
+        if last == 0 or file_size == 0:
+            raise ValueError("Unsatisfiable suffix range")
+        return max(file_size - last, 0), file_size - 1
+    if last is not None and last < first:
+        return None
+    if first >= file_size:
+        raise ValueError("Range start beyond end of file")
+    if last is None or last >= file_size:
+        last = file_size - 1
+    return first, last
+
+
+def _iter_file_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    remaining = end - start + 1
+    with path.open("rb") as fh:
+        fh.seek(start)
+        while remaining > 0:
+            chunk = fh.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _save_upload(
+    source: BinaryIO,
+    destination: Path,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> None:
+    """Stream an uploaded file to disk without buffering it in memory.
+
+    Uploads Starlette has already spooled to disk are copied in-kernel with ``os.sendfile``.
+    Raises ``ValueError`` (and removes the partial file) once more than ``max_bytes`` are read.
+    """
+
+    source.seek(0)
+    in_fd = _disk_fileno(source)
+    if in_fd is not None:
+        source.flush()
+        size = os.fstat(in_fd).st_size
+        if max_bytes is not None and size > max_bytes:
+            raise ValueError("Upload too large")
+        try:
+            _sendfile_copy(in_fd, destination, size)
+            return
+        except OSError:
+            # e.g. platforms where sendfile cannot target regular files; fall back to a plain copy
+            pass
+
+    total = 0
+    with destination.open("wb") as out:
+        while chunk := source.read(chunk_size):
+            total += len(chunk)
+            if max_bytes is not None and total > max_bytes:
+                break
+            out.write(chunk)
+    if max_bytes is not None and total > max_bytes:
+        destination.unlink(missing_ok=True)
+        raise ValueError("Upload too large")
+
+
+def _disk_fileno(source: BinaryIO) -> Optional[int]:
+    # SpooledTemporaryFile.fileno() would force an in-memory upload onto disk, so only use
+    # the descriptor once Starlette has rolled it over.
+    if isinstance(source, tempfile.SpooledTemporaryFile) and not getattr(source, "_rolled", False):
+        return None
+    try:
+        return source.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _sendfile_copy(in_fd: int, destination: Path, size: int) -> None:
+    with destination.open("wb") as out:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(out.fileno(), in_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+
+def _cached_preview_rows(csv_path: Path, limit: int) -> List[dict]:
+    """Return preview rows, reusing earlier results while the CSV is unchanged on disk."""
+
+    stat = csv_path.stat()
+    rows = _preview_rows_for_version(str(csv_path), limit, stat.st_mtime_ns, stat.st_size)
+    return [dict(row) for row in rows]
+
+
+@functools.lru_cache(maxsize=256)
+def _preview_rows_for_version(
+    csv_path: str, limit: int, mtime_ns: int, size: int
+) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+    # mtime/size are only part of the cache key so rewritten files miss the cache
+    return tuple(tuple(row.items()) for row in _load_preview_rows(Path(csv_path), limit))
+
+
 def _load_preview_rows(csv_path: Path, limit: int) -> List[dict]:
     previews: List[dict] = []
     seen_handles: set[str] = set()
-    with csv_path.open("r", encoding="utf-8-sig", newline="") as fh:
-        reader = csv.DictReader(fh)
+    with csv_path.open("rb", buffering=PREVIEW_READ_BUFFER) as raw, _utf8_text(raw) as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if not header:
+            return previews
+        handle_idx = _column_index(header, "Handle")
+        title_idx = _column_index(header, "Title")
+        body_idx = _column_index(header, "Body (HTML)")
         for row in reader:
-            handle = row.get("Handle") or ""
+            handle = _cell(row, handle_idx)
             if handle in seen_handles:
                 continue
             previews.append(
                 {
                     "handle": handle,
-                    "title": row.get("Title") or "",
-                    "body_html": row.get("Body (HTML)") or "",
+                    "title": _cell(row, title_idx),
+                    "body_html": _cell(row, body_idx),
                 }
             )
             seen_handles.add(handle)
             if len(previews) >= limit:
                 break
     return previews
+
+
+def _utf8_text(raw: BinaryIO) -> io.TextIOWrapper:
+    # skip a leading BOM by hand instead of paying for the utf-8-sig decoder
+    if raw.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+        raw.seek(0)
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def _column_index(header: List[str], name: str) -> Optional[int]:
+    try:
+        return header.index(name)
+    except ValueError:
+        return None
+
+
+def _cell(row: List[str], index: Optional[int]) -> str:
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
@@ -8,14 +8,20 @@ import shutil
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from config import Settings
-from scrape import configure_logging
+from scrape import configure_logging, flush_logging
+from scraper.archive import directory_members, write_zip
 from scraper.pipeline import PipelineResult, PipelineSettings, run_pipeline
 
 from .storage import RunStatus, RunStore
 
+ARCHIVE_NAME = "deliverables.zip"
+# Each run installs its own log file through the process-wide logging setup, so runs
+# cannot overlap without writing into each other's logs; further runs wait their turn.
+MAX_CONCURRENT_RUNS = 1
+
 
 class RunManager:
     """Coordinates scraper runs and background execution."""
@@ -26,10 +32,14 @@ class RunManager:
         settings: Settings,
         store: RunStore,
         executor: Optional[ThreadPoolExecutor] = None,
+        io_executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         self.settings = settings
         self.store = store
-        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self.executor = executor or ThreadPoolExecutor(max_workers=MAX_CONCURRENT_RUNS)
+        # archive builds get their own pool so they never queue behind the next pipeline run
+        self.io_executor = io_executor or ThreadPoolExecutor(max_workers=2)
+        self._run_slots = asyncio.BoundedSemaphore(MAX_CONCURRENT_RUNS)
 
     async def enqueue_run(self, *, input_path: Path, source: str) -> str:
         """Persist and dispatch a run using the provided input file."""
@@ -51,6 +61,14 @@ class RunManager:
         return run_id
 
     async def _run_background(self, run_id: str, input_path: Path) -> None:
+        # runs stay queued until a slot frees up, so the UI status reflects actual execution;
+        # the slot covers only the pipeline, so the next run starts while this one is zipped
+        async with self._run_slots:
+            outcome = await self._execute_run(run_id, input_path)
+        if outcome is not None:
+            await self._finalize_run(run_id, *outcome)
+
+    async def _execute_run(self, run_id: str, input_path: Path) -> Optional[Tuple[PipelineSettings, PipelineResult]]:
         self.store.mark_running(run_id)
         pipeline_settings = self._build_pipeline_settings(input_path)
 
@@ -65,13 +83,16 @@ class RunManager:
         except Exception as exc:  # pragma: no cover - defensive
             logging.exception("Run failed", extra={"run_id": run_id})
             self.store.mark_failed(run_id, str(exc))
-            return
+            return None
+        return pipeline_settings, result
 
+    async def _finalize_run(self, run_id: str, pipeline_settings: PipelineSettings, result: PipelineResult) -> None:
+        loop = asyncio.get_running_loop()
         # mark archive as pending while zipping large directories
-        pending_archive = pipeline_settings.output_dir / "deliverables.zip"
+        pending_archive = pipeline_settings.output_dir / ARCHIVE_NAME
         self.store.set_archive_path(run_id, pending_archive)
         archive_path = await loop.run_in_executor(
-            self.executor,
+            self.io_executor,
             self._prepare_archive,
             pipeline_settings.output_dir,
         )
@@ -90,10 +111,16 @@ class RunManager:
 
     def shutdown(self) -> None:
         self.executor.shutdown(wait=False, cancel_futures=True)
+        self.io_executor.shutdown(wait=False, cancel_futures=True)
+        self.store.close()
 
     def _execute_pipeline(self, run_id: str, settings: PipelineSettings) -> PipelineResult:
         configure_logging(self.settings, run_id)
-        return run_pipeline(settings)
+        try:
+            return run_pipeline(settings)
+        finally:
+            # the run log is buffered; make it complete on disk before the UI offers it
+            flush_logging()
 
     def _build_pipeline_settings(self, input_path: Path) -> PipelineSettings:
         run_output_dir = self.settings.output_root / uuid.uuid4().hex
@@ -104,6 +131,8 @@ class RunManager:
             templates_dir=self.settings.templates_root,
             proxy_url=self.settings.proxy_url,
             captcha_key=self.settings.captcha_api_key,
+            http_cache_path=self.settings.http_cache_path,
+            http_cache_expire_seconds=self.settings.http_cache_expire_seconds,
             detail_template_name=self.settings.detail_template_name,
             zip_outputs=self.settings.zip_outputs,
             zip_images_name=self.settings.zip_images_name,
@@ -111,9 +140,10 @@ class RunManager:
         )
 
     def _prepare_archive(self, output_dir: Path) -> Path:
-        temp_base = output_dir.parent / f"{output_dir.name}-deliverables"
-        temp_archive = Path(shutil.make_archive(str(temp_base), "zip", output_dir))
-        final_archive = output_dir / "deliverables.zip"
+        temp_archive = output_dir.parent / f"{output_dir.name}-deliverables.zip"
+        final_archive = output_dir / ARCHIVE_NAME
+        members = [member for member in directory_members(output_dir) if member[0] != final_archive]
+        write_zip(temp_archive, members, compresslevel=3)
         if final_archive.exists():
             final_archive.unlink()
         shutil.move(str(temp_archive), final_archive)
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, TypeVar
 
 
 class RunStatus(str, Enum):
@@ -22,20 +22,24 @@ class RunStatus(str, Enum):
 
 @dataclass
 class RunRecord:
-    """Serialized representation of a scraper run for UI consumption."""
+    """Serialized representation of a scraper run for UI consumption.
+
+    Filesystem locations are kept as the stored strings; callers that touch the
+    filesystem wrap them in ``Path`` themselves.
+    """
 
     id: str
     status: RunStatus
-    input_path: Path
+    input_path: str
     input_filename: str
     source: str
-    output_dir: Optional[Path]
-    csv_path: Optional[Path]
-    summary_path: Optional[Path]
-    images_zip_path: Optional[Path]
-    screenshots_zip_path: Optional[Path]
-    archive_path: Optional[Path]
-    log_path: Optional[Path]
+    output_dir: Optional[str]
+    csv_path: Optional[str]
+    summary_path: Optional[str]
+    images_zip_path: Optional[str]
+    screenshots_zip_path: Optional[str]
+    archive_path: Optional[str]
+    log_path: Optional[str]
     error: Optional[str]
     created_at: datetime
     updated_at: datetime
@@ -44,16 +48,16 @@ class RunRecord:
         return {
             "id": self.id,
             "status": self.status.value,
-            "input_path": str(self.input_path),
+            "input_path": self.input_path,
             "input_filename": self.input_filename,
             "source": self.source,
-            "output_dir": str(self.output_dir) if self.output_dir else None,
-            "csv_path": str(self.csv_path) if self.csv_path else None,
-            "summary_path": str(self.summary_path) if self.summary_path else None,
-            "images_zip_path": str(self.images_zip_path) if self.images_zip_path else None,
-            "screenshots_zip_path": str(self.screenshots_zip_path) if self.screenshots_zip_path else None,
-            "archive_path": str(self.archive_path) if self.archive_path else None,
-            "log_path": str(self.log_path) if self.log_path else None,
+            "output_dir": self.output_dir or None,
+            "csv_path": self.csv_path or None,
+            "summary_path": self.summary_path or None,
+            "images_zip_path": self.images_zip_path or None,
+            "screenshots_zip_path": self.screenshots_zip_path or None,
+            "archive_path": self.archive_path or None,
+            "log_path": self.log_path or None,
             "error": self.error,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
@@ -63,14 +67,64 @@ class RunRecord:
 class RunStore:
     """Lightweight SQLite-backed persistence for scraper runs."""
 
+    _SQL_INSERT_RUN = """
+        INSERT INTO runs (
+            id, status, input_path, input_filename, source,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    # Fixed statements for the run state transitions so sqlite3's statement cache can reuse them.
+    _SQL_MARK_RUNNING = "UPDATE runs SET status = ?, updated_at = ? WHERE id = ?"
+    _SQL_MARK_FAILED = "UPDATE runs SET status = ?, error = ?, updated_at = ? WHERE id = ?"
+    _SQL_MARK_SUCCEEDED = """
+        UPDATE runs SET
+            status = ?, output_dir = ?, csv_path = ?, summary_path = ?,
+            images_zip_path = ?, screenshots_zip_path = ?, archive_path = ?,
+            log_path = ?, error = NULL, updated_at = ?
+        WHERE id = ?
+    """
+    _SQL_LIST_SUMMARY = """
+        SELECT id, status, source, input_filename, archive_path, log_path, error, created_at, updated_at
+        FROM runs ORDER BY created_at DESC LIMIT ?
+    """
+    _LIST_CACHE_SIZE = 4
+    _RUN_CACHE_SIZE = 256
+    _UPDATABLE_COLUMNS = frozenset(
+        {
+            "status",
+            "output_dir",
+            "csv_path",
+            "summary_path",
+            "images_zip_path",
+            "screenshots_zip_path",
+            "archive_path",
+            "log_path",
+            "error",
+        }
+    )
+
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        self._conn = self._connect()
+        # Reads never use the write connection: a read on it while ``create_runs`` has its
+        # transaction open would see (and cache) rows that may still be rolled back. Each
+        # reading thread gets its own connection, which under WAL only sees committed data.
+        self._readers = threading.local()
+        self._reader_conns: List[sqlite3.Connection] = []
+        # Read results are memoized per write version; any write bumps the version and
+        # implicitly invalidates everything cached before it.
+        self._version = 0
+        self._cache_lock = threading.Lock()
+        self._cache_version = 0
+        self._list_cache: Dict[int, List[RunRecord]] = {}
+        self._summary_cache: Dict[int, List[dict]] = {}
+        self._run_cache: Dict[str, Optional[RunRecord]] = {}
 
     def initialize(self) -> None:
-        with self._connect() as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS runs (
                     id TEXT PRIMARY KEY,
@@ -91,7 +145,7 @@ class RunStore:
                 )
                 """
             )
-            conn.commit()
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC)")
 
     def create_run(
         self,
@@ -102,30 +156,53 @@ class RunStore:
         source: str,
         status: RunStatus = RunStatus.QUEUED,
     ) -> None:
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = _utcnow()
+        self._execute_write(
+            self._SQL_INSERT_RUN,
+            (
+                run_id,
+                status.value,
+                str(input_path),
+                input_filename,
+                source,
+                timestamp,
+                timestamp,
+            ),
+        )
+
+    def create_runs(self, runs: Iterable[Mapping[str, Any]]) -> None:
+        """Insert several runs in a single transaction.
+
+        Each mapping takes the same keys as ``create_run``'s keyword arguments.
+        """
+
+        timestamp = _utcnow()
+        params = [
+            (
+                run["run_id"],
+                RunStatus(run.get("status", RunStatus.QUEUED)).value,
+                str(run["input_path"]),
+                run["input_filename"],
+                run["source"],
+                timestamp,
+                timestamp,
+            )
+            for run in runs
+        ]
+        if not params:
+            return
         with self._lock:
-            with self._connect() as conn:
-                conn.execute(
-                    """
-                    INSERT INTO runs (
-                        id, status, input_path, input_filename, source,
-                        created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        run_id,
-                        status.value,
-                        str(input_path),
-                        input_filename,
-                        source,
-                        timestamp,
-                        timestamp,
-                    ),
-                )
-                conn.commit()
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(self._SQL_INSERT_RUN, params)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            self._version += 1
 
     def mark_running(self, run_id: str) -> None:
-        self._update_fields(run_id, status=RunStatus.RUNNING)
+        self._execute_write(self._SQL_MARK_RUNNING, (RunStatus.RUNNING.value, _utcnow(), run_id))
 
     def mark_succeeded(
         self,
@@ -139,21 +216,24 @@ class RunStore:
         archive_path: Optional[Path],
         log_path: Optional[Path],
     ) -> None:
-        self._update_fields(
-            run_id,
-            status=RunStatus.SUCCEEDED,
-            output_dir=str(output_dir),
-            csv_path=str(csv_path) if csv_path else None,
-            summary_path=str(summary_path) if summary_path else None,
-            images_zip_path=str(images_zip_path) if images_zip_path else None,
-            screenshots_zip_path=str(screenshots_zip_path) if screenshots_zip_path else None,
-            archive_path=str(archive_path) if archive_path else None,
-            log_path=str(log_path) if log_path else None,
-            error=None,
+        self._execute_write(
+            self._SQL_MARK_SUCCEEDED,
+            (
+                RunStatus.SUCCEEDED.value,
+                str(output_dir),
+                str(csv_path) if csv_path else None,
+                str(summary_path) if summary_path else None,
+                str(images_zip_path) if images_zip_path else None,
+                str(screenshots_zip_path) if screenshots_zip_path else None,
+                str(archive_path) if archive_path else None,
+                str(log_path) if log_path else None,
+                _utcnow(),
+                run_id,
+            ),
         )
 
     def mark_failed(self, run_id: str, error: str) -> None:
-        self._update_fields(run_id, status=RunStatus.FAILED, error=error)
+        self._execute_write(self._SQL_MARK_FAILED, (RunStatus.FAILED.value, error, _utcnow(), run_id))
 
     def set_archive_path(self, run_id: str, archive_path: Optional[Path]) -> None:
         path_str = str(archive_path) if archive_path else None
@@ -163,23 +243,64 @@ class RunStore:
         self._update_fields(run_id, error=error)
 
     def get_run(self, run_id: str) -> Optional[RunRecord]:
-        with self._connect() as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
-        if not row:
-            return None
-        return self._row_to_record(row)
+        # read the version before querying so a concurrent write can only make the entry unreachable
+        version = self._version
+        with self._cache_lock:
+            self._sync_cache(version)
+            if run_id in self._run_cache:
+                return self._run_cache[run_id]
+
+        row = self._reader().execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        record = self._row_to_record(row) if row else None
+        with self._cache_lock:
+            if self._cache_version == version:
+                _bounded_put(self._run_cache, run_id, record, self._RUN_CACHE_SIZE)
+        return record
 
     def list_runs(self, limit: int = 20) -> Iterable[RunRecord]:
-        with self._connect() as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                "SELECT * FROM runs ORDER BY datetime(created_at) DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
-        return [self._row_to_record(row) for row in rows]
+        version = self._version
+        with self._cache_lock:
+            self._sync_cache(version)
+            cached = self._list_cache.get(limit)
+        if cached is not None:
+            return list(cached)
+
+        rows = self._reader().execute(
+            # created_at holds ISO-8601 strings, which sort chronologically as text
+            "SELECT * FROM runs ORDER BY created_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        records = [self._row_to_record(row) for row in rows]
+        with self._cache_lock:
+            if self._cache_version == version:
+                _bounded_put(self._list_cache, limit, records, self._LIST_CACHE_SIZE)
+        return list(records)
+
+    def list_runs_summary(self, limit: int = 20) -> List[dict]:
+        """Return the newest runs with only the columns the run list UI renders.
+
+        Results are cached per write version and shared between callers; do not mutate them.
+        """
+
+        version = self._version
+        with self._cache_lock:
+            self._sync_cache(version)
+            cached = self._summary_cache.get(limit)
+        if cached is not None:
+            return cached
+
+        rows = self._reader().execute(self._SQL_LIST_SUMMARY, (limit,)).fetchall()
+        summaries = [dict(row) for row in rows]
+        with self._cache_lock:
+            if self._cache_version == version:
+                _bounded_put(self._summary_cache, limit, summaries, self._LIST_CACHE_SIZE)
+        return summaries
 
     def _update_fields(self, run_id: str, **fields: Optional[str | RunStatus]) -> None:
+        unknown = set(fields) - self._UPDATABLE_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown run columns: {', '.join(sorted(unknown))}")
+
         assignments = []
         values: list[Optional[str]] = []
         for key, value in fields.items():
@@ -188,35 +309,77 @@ class RunStore:
             assignments.append(f"{key} = ?")
             values.append(value)
         assignments.append("updated_at = ?")
-        values.append(datetime.utcnow().isoformat())
+        values.append(_utcnow())
         values.append(run_id)
 
+        self._execute_write(f"UPDATE runs SET {', '.join(assignments)} WHERE id = ?", values)
+
+    def _execute_write(self, sql: str, params: Sequence[Optional[str]]) -> None:
         with self._lock:
-            with self._connect() as conn:
-                conn.execute(
-                    f"UPDATE runs SET {', '.join(assignments)} WHERE id = ?",
-                    values,
-                )
-                conn.commit()
+            self._conn.execute(sql, params)
+            self._version += 1
+
+    def _sync_cache(self, version: int) -> None:
+        if self._cache_version != version:
+            self._list_cache.clear()
+            self._summary_cache.clear()
+            self._run_cache.clear()
+            self._cache_version = version
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+            readers, self._reader_conns = self._reader_conns, []
+        for conn in readers:
+            conn.close()
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            conn = self._readers.conn = self._connect()
+            with self._lock:
+                self._reader_conns.append(conn)
+        return conn
 
     def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+        # Autocommit connections; writes go through the one write connection under ``self._lock``.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
 
     def _row_to_record(self, row: sqlite3.Row) -> RunRecord:
         return RunRecord(
             id=row["id"],
             status=RunStatus(row["status"]),
-            input_path=Path(row["input_path"]),
+            input_path=row["input_path"],
             input_filename=row["input_filename"],
             source=row["source"],
-            output_dir=Path(row["output_dir"]) if row["output_dir"] else None,
-            csv_path=Path(row["csv_path"]) if row["csv_path"] else None,
-            summary_path=Path(row["summary_path"]) if row["summary_path"] else None,
-            images_zip_path=Path(row["images_zip_path"]) if row["images_zip_path"] else None,
-            screenshots_zip_path=Path(row["screenshots_zip_path"]) if row["screenshots_zip_path"] else None,
-            archive_path=Path(row["archive_path"]) if row["archive_path"] else None,
-            log_path=Path(row["log_path"]) if row["log_path"] else None,
+            output_dir=row["output_dir"],
+            csv_path=row["csv_path"],
+            summary_path=row["summary_path"],
+            images_zip_path=row["images_zip_path"],
+            screenshots_zip_path=row["screenshots_zip_path"],
+            archive_path=row["archive_path"],
+            log_path=row["log_path"],
             error=row["error"],
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
         )
+
+
+_V = TypeVar("_V")
+
+
+def _bounded_put(cache: Dict[Any, _V], key: Hashable, value: _V, max_size: int) -> None:
+    if key not in cache and len(cache) >= max_size:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def _utcnow() -> str:
+    # Fixed-width ISO-8601 so created_at/updated_at always compare chronologically as text.
+    return datetime.utcnow().isoformat(timespec="microseconds")
@@ -29,9 +29,12 @@ class Settings:
     schedule_cron: str = "0 2 * * *"  # default 2 AM daily
     proxy_url: Optional[str] = None
     captcha_api_key: Optional[str] = None
+    http_cache_path: Optional[Path] = None
+    http_cache_expire_seconds: int = 3600
     ui_database_path: Path = Path("ui_runs.db")
     ui_basic_auth_username: Optional[str] = None
     ui_basic_auth_password: Optional[str] = None
+    ui_max_upload_bytes: int = 50 * 1024 * 1024
 
 
 def load_settings(env_file: str | Path = ".env") -> Settings:
@@ -57,9 +60,12 @@ def load_settings(env_file: str | Path = ".env") -> Settings:
         schedule_cron=_get_env("SCRAPER_SCHEDULE_CRON", "0 2 * * *"),
         proxy_url=_get_env("SCRAPER_PROXY_URL"),
         captcha_api_key=_get_env("SCRAPER_CAPTCHA_API_KEY"),
+        http_cache_path=_optional_path(_get_env("SCRAPER_HTTP_CACHE_PATH")),
+        http_cache_expire_seconds=int(_get_env("SCRAPER_HTTP_CACHE_EXPIRE_SECONDS", "3600")),
         ui_database_path=Path(_get_env("SCRAPER_UI_DB_PATH", "ui_runs.db")),
         ui_basic_auth_username=_get_env("SCRAPER_UI_USERNAME"),
         ui_basic_auth_password=_get_env("SCRAPER_UI_PASSWORD"),
+        ui_max_upload_bytes=int(_get_env("SCRAPER_UI_MAX_UPLOAD_BYTES", str(50 * 1024 * 1024))),
     )
 
 
@@ -3,20 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import logging
+import multiprocessing
+import queue
 import subprocess
 import sys
-import time
+import threading
 from dataclasses import replace
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.executors.pool import ProcessPoolExecutor
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from config import Settings, load_settings
 from scraper.pipeline import PipelineSettings, run_pipeline
+from scraper.puppeteer_pool import PuppeteerWorker
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+LOG_FILE_BUFFER = 64 * 1024
+# Scheduled runs execute in their own processes; at most this many may overlap.
+SCHEDULER_MAX_RUNS = 2
+
+_log_listener: Optional[QueueListener] = None
+_puppeteer_worker: Optional[PuppeteerWorker] = None
 
 
 def parse_args() -> argparse.Namespace:
@@ -95,8 +109,16 @@ def _validate_settings(settings: Settings) -> None:
     settings.templates_root.mkdir(parents=True, exist_ok=True)
 
 
-def run_once(settings: Settings, run_id: Optional[str] = None) -> Path:
-    """Execute a single scraper run and return the output directory."""
+def run_once(
+    settings: Settings,
+    run_id: Optional[str] = None,
+    puppeteer_worker: Optional[PuppeteerWorker] = None,
+) -> Path:
+    """Execute a single scraper run and return the output directory.
+
+    Screenshots go through ``puppeteer_worker`` when one is given, otherwise through a
+    one-off Node process.
+    """
 
     run_identifier = run_id or datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     run_output_dir = settings.output_root / run_identifier
@@ -113,6 +135,8 @@ def run_once(settings: Settings, run_id: Optional[str] = None) -> Path:
         templates_dir=settings.templates_root,
         proxy_url=settings.proxy_url,
         captcha_key=settings.captcha_api_key,
+        http_cache_path=settings.http_cache_path,
+        http_cache_expire_seconds=settings.http_cache_expire_seconds,
         detail_template_name=settings.detail_template_name,
         zip_outputs=settings.zip_outputs,
         zip_images_name=settings.zip_images_name,
@@ -128,69 +152,190 @@ def run_once(settings: Settings, run_id: Optional[str] = None) -> Path:
     logging.info("CSV written to: %s", result.csv_path)
     logging.info("Summary written to: %s", result.summary_path)
 
-    _maybe_run_puppeteer(settings, run_output_dir)
+    _maybe_run_puppeteer(settings, run_output_dir, puppeteer_worker)
 
     return run_output_dir
 
 
 def configure_logging(settings: Settings, run_id: str) -> None:
     log_file = settings.logs_root / f"scraper-{run_id}.log"
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(log_file, encoding="utf-8"),
-        ],
-        force=True,
+    _install_log_handlers(
+        logging.StreamHandler(sys.stdout),
+        BufferedFileHandler(log_file),
     )
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """Run-log handler that lets a write buffer coalesce lines instead of flushing each one.
+
+    The buffer is flushed on ERROR and above, by ``flush_logging`` and when the handler closes.
+    """
+
+    def __init__(self, filename: Path, buffer_size: int = LOG_FILE_BUFFER) -> None:
+        self.buffer_size = buffer_size
+        super().__init__(filename, encoding="utf-8", delay=True)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def flush_logging() -> None:
+    """Wait for queued log records to be written and flush the handlers' buffers."""
+
+    listener = _log_listener
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+    listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued log records to their handlers and stop the background listener."""
+
+    global _log_listener
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    listener, _log_listener = _log_listener, None
+    _stop_listener(listener)
+
+
+def _install_log_handlers(*handlers: logging.Handler) -> None:
+    # Logging threads only enqueue records; a single listener thread formats them and does
+    # the stream/file writes, so scraping never blocks on log I/O.
+    global _log_listener
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+        existing.close()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    # the old listener is stopped only after the swap, so it drains everything queued before it
+    previous, _log_listener = _log_listener, listener
+    _stop_listener(previous)
+
+
+def _stop_listener(listener: Optional[QueueListener]) -> None:
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_logging)
+
+
 def run_scheduler(settings: Settings) -> None:
     cron_expr = settings.schedule_cron
-    scheduler = BlockingScheduler()
+    # Each run gets its own interpreter, so overlapping runs neither share the GIL nor
+    # the process-wide logging setup. Spawned (not forked) because this process already
+    # runs the scheduler and log listener threads.
+    scheduler = BackgroundScheduler(
+        executors={
+            "default": ProcessPoolExecutor(
+                SCHEDULER_MAX_RUNS,
+                pool_kwargs={"mp_context": multiprocessing.get_context("spawn")},
+            )
+        }
+    )
     trigger = CronTrigger.from_crontab(cron_expr)
-    scheduler.add_job(run_once, trigger, args=[settings])
+    # coalesce: a backlog of missed fire times (e.g. after an overrunning run) collapses into one run
+    scheduler.add_job(run_scheduled, trigger, args=[settings], coalesce=True, max_instances=SCHEDULER_MAX_RUNS)
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-        force=True,
-    )
+    _install_log_handlers(logging.StreamHandler(sys.stdout))
     logging.info("Scheduler started with cron: %s", cron_expr)
 
+    scheduler.start()
     try:
-        scheduler.start()
+        threading.Event().wait()
     except (KeyboardInterrupt, SystemExit):
         logging.info("Scheduler shutdown requested")
         scheduler.shutdown()
 
 
-def main() -> None:
-    args = parse_args()
-    settings = resolve_settings(args)
+def run_scheduled(settings: Settings) -> Path:
+    """Scheduler job: one run inside a pool process, reusing that process's Puppeteer worker."""
 
-    if args.schedule or settings.schedule_enabled:
-        run_scheduler(settings)
-    else:
-        run_once(settings, run_id=args.run_id)
-        # Allow time for asynchronous logging handlers to flush.
-        time.sleep(0.25)
+    try:
+        return run_once(settings, puppeteer_worker=_scheduled_puppeteer_worker(settings))
+    finally:
+        # pool processes exit without running atexit hooks, so flush the buffered run log here
+        flush_logging()
 
 
-def _maybe_run_puppeteer(settings: Settings, run_output_dir: Path) -> None:
-    if not settings.puppeteer_enabled:
-        return
+def _scheduled_puppeteer_worker(settings: Settings) -> Optional[PuppeteerWorker]:
+    # One warm Node/Chromium per pool process, kept for the life of the process. The daemon
+    # exits on its own when stdin closes, i.e. when this process goes away.
+    global _puppeteer_worker
+    if _puppeteer_worker is None:
+        script_path = _puppeteer_script(settings)
+        if script_path is not None:
+            _puppeteer_worker = PuppeteerWorker(settings.puppeteer_bin or Path("node"), script_path)
+    return _puppeteer_worker
 
-    script_path = settings.puppeteer_script or Path(__file__).resolve().parent.parent / "web-scraper-node" / "scrape.js"
-    if not script_path.exists():
-        logging.warning("Puppeteer script not found; skipping screenshot capture", extra={"script": str(script_path)})
+
+def main() -> None:
+    args = parse_args()
+    settings = resolve_settings(args)
+
+    try:
+        if args.schedule or settings.schedule_enabled:
+            run_scheduler(settings)
+        else:
+            run_once(settings, run_id=args.run_id)
+    finally:
+        # drains the listener queue and closes the handlers deterministically
+        stop_logging()
+        logging.shutdown()
+
+
+def _maybe_run_puppeteer(
+    settings: Settings,
+    run_output_dir: Path,
+    worker: Optional[PuppeteerWorker] = None,
+) -> None:
+    script_path = _puppeteer_script(settings)
+    if script_path is None:
         return
 
     node_bin = settings.puppeteer_bin or Path("node")
     output_dir = settings.puppeteer_output_dir or (run_output_dir / "screenshots")
 
+    if worker is not None:
+        logging.info("Requesting screenshots from Puppeteer worker", extra={"output": str(output_dir)})
+        try:
+            saved = worker.capture(settings.input_urls_path, output_dir)
+        except (OSError, RuntimeError) as exc:
+            logging.error("Puppeteer capture failed", extra={"error": str(exc)})
+            return
+        logging.info("Puppeteer saved %s screenshots", len(saved))
+        return
+
     cmd = [
         str(node_bin),
         str(script_path),
@@ -203,9 +348,35 @@ def _maybe_run_puppeteer(settings: Settings, run_output_dir: Path) -> None:
     logging.info("Launching Puppeteer screenshot capture", extra={"command": " ".join(cmd)})
 
     try:
-        subprocess.run(cmd, check=True, cwd=script_path.parent)
-    except (OSError, subprocess.CalledProcessError) as exc:
+        # stream the script's output into the run log instead of the parent's stdout
+        with subprocess.Popen(
+            cmd,
+            cwd=script_path.parent,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        ) as proc:
+            for line in proc.stdout:
+                logging.info("puppeteer: %s", line.rstrip())
+            returncode = proc.wait()
+    except OSError as exc:
         logging.error("Puppeteer capture failed", extra={"error": str(exc)})
+        return
+    if returncode != 0:
+        logging.error("Puppeteer capture failed", extra={"error": f"exit status {returncode}"})
+
+
+def _puppeteer_script(settings: Settings) -> Optional[Path]:
+    if not settings.puppeteer_enabled:
+        return None
+
+    script_path = settings.puppeteer_script or Path(__file__).resolve().parent.parent / "web-scraper-node" / "scrape.js"
+    if not script_path.exists():
+        logging.warning("Puppeteer script not found; skipping screenshot capture", extra={"script": str(script_path)})
+        return None
+    return script_path
 
 
 if __name__ == "__main__":
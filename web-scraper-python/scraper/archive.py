@@ -0,0 +1,88 @@
+"""Zip writing shared by the pipeline archives and the UI deliverable."""
+
+from __future__ import annotations
+
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterable, List, Optional, Tuple
+
+# Already-compressed payloads are stored as-is; deflating them again costs CPU for ~no gain.
+STORED_SUFFIXES = frozenset({".zip", ".jpg", ".jpeg", ".png", ".gif", ".webp"})
+ARCHIVE_READAHEAD = 8
+ARCHIVE_READAHEAD_MAX_BYTES = 8 * 1024 * 1024
+ARCHIVE_READER_THREADS = 4
+
+
+def directory_members(root: Path) -> List[Tuple[Path, str]]:
+    """List every file under ``root`` as ``(path, arcname)``, sorted by arcname.
+
+    One ``os.scandir`` walk; ``DirEntry`` answers the file/dir checks from the directory
+    listing itself, so no per-entry ``stat`` is needed. A missing ``root`` yields nothing.
+    """
+
+    members: List[Tuple[Path, str]] = []
+    pending = [(str(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                arcname = prefix + entry.name
+                if entry.is_dir():
+                    pending.append((entry.path, arcname + "/"))
+                elif entry.is_file():
+                    members.append((Path(entry.path), arcname))
+    members.sort(key=lambda member: member[1])
+    return members
+
+
+def write_zip(
+    destination: Path,
+    members: Iterable[Tuple[Path, str]],
+    *,
+    compresslevel: Optional[int] = None,
+) -> int:
+    """Write ``(path, arcname)`` members into a new zip at ``destination``; returns the count.
+
+    zipfile supports a single writer, so the calling thread compresses and writes while a small
+    thread pool reads the next few files ahead of it. Files above ``ARCHIVE_READAHEAD_MAX_BYTES``
+    are streamed by the writer instead of being held in memory.
+    """
+
+    count = 0
+    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive, ThreadPoolExecutor(
+        max_workers=ARCHIVE_READER_THREADS
+    ) as readers:
+        pending: Deque[Tuple[Path, zipfile.ZipInfo, Optional[Future]]] = deque()
+        for path, arcname in members:
+            info = zipfile.ZipInfo.from_file(path, arcname=arcname)
+            prefetch = readers.submit(path.read_bytes) if info.file_size <= ARCHIVE_READAHEAD_MAX_BYTES else None
+            pending.append((path, info, prefetch))
+            if len(pending) >= ARCHIVE_READAHEAD:
+                _write_member(archive, *pending.popleft(), compresslevel)
+                count += 1
+        while pending:
+            _write_member(archive, *pending.popleft(), compresslevel)
+            count += 1
+    return count
+
+
+def _write_member(
+    archive: zipfile.ZipFile,
+    path: Path,
+    info: zipfile.ZipInfo,
+    prefetch: Optional[Future],
+    compresslevel: Optional[int],
+) -> None:
+    compress_type = zipfile.ZIP_STORED if path.suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+    if prefetch is None:
+        archive.write(path, arcname=info.filename, compress_type=compress_type, compresslevel=compresslevel)
+        return
+    # a ZipInfo member ignores the archive-wide level, so it is passed per member
+    archive.writestr(info, prefetch.result(), compress_type=compress_type, compresslevel=compresslevel)
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import random
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 
 
 @dataclass
@@ -16,6 +22,9 @@ class RequestConfig:
     jitter: float = 2.0
     user_agents: Optional[Iterable[str]] = None
     proxy_url: Optional[str] = None
+    # SQLite file for the HTTP response cache; ``None`` disables caching
+    cache_path: Optional[Path] = None
+    cache_expire_after: int = 3600
 
 
 DEFAULT_USER_AGENTS = [
@@ -24,25 +33,136 @@ DEFAULT_USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Firefox/118.0",
 ]
 
+# recently fetched pages kept in memory, so near-duplicate input URLs skip the network
+FETCH_MEMO_SIZE = 128
+
+
+def canonical_url(url: str) -> str:
+    """Normalize ``url`` for identity checks: lowercase scheme/host, sorted query, no trailing slash."""
+
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+class RateLimiter:
+    """Thread-safe request pacing: one slot every ``base_delay`` + random jitter seconds.
+
+    Callers only sleep for whatever part of the interval has not already elapsed, so
+    work done between requests (parsing, image downloads) counts towards the delay.
+    """
+
+    def __init__(self, base_delay: float, jitter: float) -> None:
+        self.base_delay = base_delay
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.base_delay + random.uniform(0, self.jitter)
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Transport adapter that takes a rate-limit slot for every request sent over the network.
+
+    Pacing at the transport rather than in ``fetch`` means responses served by the HTTP cache
+    never wait for a slot; only real requests, revalidations included, are paced.
+    """
+
+    def __init__(self, limiter_for: Callable[[str], RateLimiter]) -> None:
+        super().__init__()
+        self._limiter_for = limiter_for
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        self._limiter_for(request.url).acquire()
+        return super().send(request, **kwargs)
+
 
 class Cafe24Client:
-    """HTTP client with naive rate limiting and user-agent rotation."""
+    """HTTP client with per-host rate limiting and user-agent rotation.
+
+    Each calling thread gets its own session, so pipeline workers keep their connection to
+    the shop alive across products instead of contending for one shared connection pool.
+    """
 
     def __init__(self, config: RequestConfig) -> None:
         self.config = config
+        # materialized once: user_agents may be any iterable, including a one-shot generator
+        self._agents = tuple(config.user_agents or ()) or tuple(DEFAULT_USER_AGENTS)
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        self._responses: "OrderedDict[str, requests.Response]" = OrderedDict()
+        self._responses_lock = threading.Lock()
 
     def fetch(self, url: str) -> requests.Response:
+        key = canonical_url(url)
+        with self._responses_lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+
         headers = {"User-Agent": self._choose_user_agent()}
         proxies = {"http": self.config.proxy_url, "https": self.config.proxy_url} if self.config.proxy_url else None
-        response = requests.get(url, headers=headers, proxies=proxies, timeout=30)
-        self._apply_delay()
+        response = self._session().get(url, headers=headers, proxies=proxies, timeout=30)
         response.raise_for_status()
+
+        with self._responses_lock:
+            self._responses[key] = response
+            if len(self._responses) > FETCH_MEMO_SIZE:
+                self._responses.popitem(last=False)
         return response
 
+    def close(self) -> None:
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._build_session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _build_session(self) -> requests.Session:
+        if self.config.cache_path is None:
+            session = requests.Session()
+        else:
+            self.config.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Cache-Control/Expires from the shop take precedence over ``cache_expire_after``; once
+            # an entry expires it is revalidated with If-None-Match/If-Modified-Since, so unchanged
+            # pages come back as a 304 and are served from the cache.
+            session = requests_cache.CachedSession(
+                cache_name=str(self.config.cache_path),
+                backend="sqlite",
+                expire_after=self.config.cache_expire_after,
+                cache_control=True,
+            )
+        adapter = RateLimitedAdapter(self._limiter_for)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _choose_user_agent(self) -> str:
-        agents = list(self.config.user_agents or DEFAULT_USER_AGENTS)
-        return random.choice(agents)
+        return random.choice(self._agents)
 
-    def _apply_delay(self) -> None:
-        delay = self.config.base_delay + random.uniform(0, self.config.jitter)
-        time.sleep(delay)
+    def _limiter_for(self, url: str) -> RateLimiter:
+        host = urlsplit(url).netloc.lower()
+        with self._limiters_lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = RateLimiter(self.config.base_delay, self.config.jitter)
+        return limiter
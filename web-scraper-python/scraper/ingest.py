@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import csv
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
 
+import orjson
+
+CSV_READ_BUFFER = 1 << 20
+
 
 @dataclass
 class ProductInput:
@@ -31,19 +34,22 @@ class InputLoader:
         return list(self._load_json())
 
     def _load_csv(self) -> Iterable[ProductInput]:
-        with self.path.open(newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            if "url" not in reader.fieldnames:
+        with self.path.open(newline="", encoding="utf-8-sig", buffering=CSV_READ_BUFFER) as handle:
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if not header or "url" not in header:
                 raise ValueError("CSV must contain a 'url' column")
+            url_idx = header.index("url")
             for row in reader:
-                url = (row.get("url") or "").strip()
+                if url_idx >= len(row):
+                    continue
+                url = row[url_idx].strip()
                 if not url:
                     continue
                 yield ProductInput(url=url)
 
     def _load_json(self) -> Iterable[ProductInput]:
-        with self.path.open(encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = orjson.loads(self.path.read_bytes())
         if not isinstance(data, list):
             raise ValueError("JSON input must be a list of objects with 'url'")
         for entry in data:
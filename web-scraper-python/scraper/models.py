@@ -74,7 +74,10 @@ class ShopifyRecord:
         }
 
         if not self.variants:
-            rows.append({**base_row, **_empty_variant_row(), **_empty_image_row()})
+            row = base_row.copy()
+            row.update(_empty_variant_row())
+            row.update(_empty_image_row())
+            rows.append(row)
             return rows
 
         for idx, variant in enumerate(self.variants):
@@ -91,8 +94,11 @@ class ShopifyRecord:
                 "Variant Grams": variant.grams,
             }
 
-            image_row = _image_row(self.images, idx)
-            rows.append({**base_row, **variant_row, **image_row})
+            # copy + update grows one dict in place instead of unpacking three into a fresh one
+            row = base_row.copy()
+            row.update(variant_row)
+            row.update(_image_row(self.images, idx))
+            rows.append(row)
 
         return rows
 
@@ -2,55 +2,85 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, Tag
 
 from .models import RawProductData
 from .utils import split_tags
 
+# thousands separators, won signs (regular and fullwidth) and whitespace, dropped in one C-level pass
+_PRICE_STRIP = str.maketrans("", "", ",\u20a9\uffe6 \t\n\r")
+
 
 class Cafe24Parser:
     """Parse Cafe24 product HTML into RawProductData."""
 
+    # Selectors are compiled once here rather than looked up on every select() call.
+    _SEL_TITLE = sv.compile(".product_tit, #prdDetail h2, .infoArea h3")
+    _SEL_SKU = sv.compile(".product_sku, #product_detail_info [data-sku], .infoArea .info li span.sku")
+    _SEL_TABLE_ROWS = sv.compile("table tr")
+    _SEL_VENDOR = sv.compile(".product_vendor, .infoArea .info li span.supplier")
+    _SEL_BREADCRUMB = sv.compile(".path li a, .xans-product-menupackage a, nav.breadcrumb a")
+    _SEL_TAGS = sv.compile(".product_tags a")
+    _SEL_DETAIL = sv.compile("#prdDetail, .cont_detail, .productDetail")
+    _SEL_DESCRIPTION_KO = sv.compile(".product-detail-ko, [lang=ko]")
+    _SEL_DESCRIPTION_EN = sv.compile(".product-detail-en, [lang=en]")
+    _SEL_PRICE = sv.compile(".product_price, .price .sell")
+    _SEL_SALE_PRICE = sv.compile(".price .strike")
+    _SEL_GALLERY = sv.compile(".product_thumbs img, .xans-product-addimage img")
+
     def parse(self, url: str, html: str) -> RawProductData:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
+        meta = self._collect_meta(soup)
         raw = RawProductData(source_url=url)
 
-        raw.title = self._parse_title(soup)
-        raw.sku = self._parse_sku(soup)
-        raw.vendor = self._parse_vendor(soup)
-        raw.product_type = self._parse_product_type(soup)
-        raw.tags = self._parse_tags(soup)
-        raw.description_html = self._parse_description(soup)
+        raw.title = self._parse_title(soup, meta)
+        raw.sku = self._parse_sku(soup, meta)
+        raw.vendor = self._parse_vendor(soup, meta)
+        raw.product_type = self._parse_product_type(soup, meta)
+        raw.tags = self._parse_tags(soup, meta)
+        # each selector walks the whole tree, so the detail section is located once and shared
+        detail_section = self._SEL_DETAIL.select_one(soup)
+        raw.description_html = self._parse_description(detail_section)
         raw.description_ko, raw.description_en = self._parse_multilingual_descriptions(soup)
-        raw.price, raw.sale_price, raw.currency = self._parse_price(soup)
-        raw.main_image, raw.gallery_images = self._parse_images(soup, url)
-        raw.detail_images = self._parse_detail_images(soup, url)
+        raw.price, raw.sale_price, raw.currency = self._parse_price(soup, meta)
+        raw.main_image, raw.gallery_images = self._parse_images(soup, meta, url)
+        raw.detail_images = self._parse_detail_images(detail_section, url)
 
         return raw
 
-    def _parse_title(self, soup: BeautifulSoup) -> Optional[str]:
-        meta_title = soup.find("meta", property="og:title")
-        if meta_title and meta_title.get("content"):
-            return meta_title["content"].strip()
-        title_node = soup.select_one(".product_tit, #prdDetail h2, .infoArea h3")
+    def _collect_meta(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """Map each ``<meta>`` property/name to its content in a single pass (first tag wins)."""
+
+        meta: Dict[str, str] = {}
+        for node in soup.find_all("meta"):
+            content = node.get("content") or ""
+            for key in (node.get("property"), node.get("name")):
+                if key:
+                    meta.setdefault(key, content)
+        return meta
+
+    def _parse_title(self, soup: BeautifulSoup, meta: Dict[str, str]) -> Optional[str]:
+        if meta.get("og:title"):
+            return meta["og:title"].strip()
+        title_node = self._SEL_TITLE.select_one(soup)
         if title_node:
             return title_node.get_text(strip=True)
         return None
 
-    def _parse_sku(self, soup: BeautifulSoup) -> Optional[str]:
-        sku_node = soup.select_one(".product_sku, #product_detail_info [data-sku], .infoArea .info li span.sku")
+    def _parse_sku(self, soup: BeautifulSoup, meta: Dict[str, str]) -> Optional[str]:
+        sku_node = self._SEL_SKU.select_one(soup)
         if sku_node:
             return sku_node.get_text(strip=True)
-        meta_sku = soup.find("meta", property="product:retailer_item_id")
-        if meta_sku and meta_sku.get("content"):
-            return meta_sku["content"].strip()
+        if meta.get("product:retailer_item_id"):
+            return meta["product:retailer_item_id"].strip()
         return None
 
-    def _parse_vendor(self, soup: BeautifulSoup) -> Optional[str]:
-        detail_table_rows = soup.select("table tr")
+    def _parse_vendor(self, soup: BeautifulSoup, meta: Dict[str, str]) -> Optional[str]:
+        detail_table_rows = self._SEL_TABLE_ROWS.select(soup)
         for row in detail_table_rows:
             header = row.find("th")
             if not header:
@@ -63,69 +93,65 @@ class Cafe24Parser:
                     if value:
                         return value
 
-        vendor_meta = soup.find("meta", property="og:site_name")
-        if vendor_meta and vendor_meta.get("content"):
-            return vendor_meta["content"].strip()
-        vendor_node = soup.select_one(".product_vendor, .infoArea .info li span.supplier")
+        if meta.get("og:site_name"):
+            return meta["og:site_name"].strip()
+        vendor_node = self._SEL_VENDOR.select_one(soup)
         if vendor_node:
             return vendor_node.get_text(strip=True)
         return None
 
-    def _parse_product_type(self, soup: BeautifulSoup) -> Optional[str]:
-        meta_type = soup.find("meta", property="product:category")
-        if meta_type and meta_type.get("content"):
-            return meta_type["content"].strip()
+    def _parse_product_type(self, soup: BeautifulSoup, meta: Dict[str, str]) -> Optional[str]:
+        if meta.get("product:category"):
+            return meta["product:category"].strip()
 
-        breadcrumb = soup.select(".path li a, .xans-product-menupackage a, nav.breadcrumb a")
+        breadcrumb = self._SEL_BREADCRUMB.select(soup)
         if breadcrumb:
             return breadcrumb[-1].get_text(strip=True)
         return None
 
-    def _parse_tags(self, soup: BeautifulSoup) -> list[str]:
-        tag_nodes = soup.select(".product_tags a")
+    def _parse_tags(self, soup: BeautifulSoup, meta: Dict[str, str]) -> list[str]:
+        tag_nodes = self._SEL_TAGS.select(soup)
         if tag_nodes:
             return [node.get_text(strip=True) for node in tag_nodes if node.get_text(strip=True)]
-        tag_meta = soup.find("meta", attrs={"name": "keywords"})
-        if tag_meta and tag_meta.get("content"):
-            return split_tags(tag_meta["content"])
+        if meta.get("keywords"):
+            return split_tags(meta["keywords"])
         return []
 
-    def _parse_description(self, soup: BeautifulSoup) -> Optional[str]:
-        detail_section = soup.select_one("#prdDetail, .cont_detail, .productDetail")
+    def _parse_description(self, detail_section: Optional[Tag]) -> Optional[str]:
         if detail_section:
             return str(detail_section)
         return None
 
     def _parse_multilingual_descriptions(self, soup: BeautifulSoup) -> tuple[Optional[str], Optional[str]]:
-        ko_node = soup.select_one(".product-detail-ko, [lang=ko]")
-        en_node = soup.select_one(".product-detail-en, [lang=en]")
+        ko_node = self._SEL_DESCRIPTION_KO.select_one(soup)
+        en_node = self._SEL_DESCRIPTION_EN.select_one(soup)
         ko_text = ko_node.get_text("\n", strip=True) if ko_node else None
         en_text = en_node.get_text("\n", strip=True) if en_node else None
         return ko_text, en_text
 
-    def _parse_price(self, soup: BeautifulSoup) -> tuple[Optional[float], Optional[float], Optional[str]]:
-        amount_meta = soup.find("meta", property="product:price:amount")
-        currency_meta = soup.find("meta", property="product:price:currency")
-        sale_meta = soup.find("meta", property="product:sale_price:amount")
-        price = self._to_float(amount_meta.get("content") if amount_meta else None)
-        sale_price = self._to_float(sale_meta.get("content") if sale_meta else None)
-        currency = currency_meta.get("content") if currency_meta else None
+    def _parse_price(
+        self, soup: BeautifulSoup, meta: Dict[str, str]
+    ) -> tuple[Optional[float], Optional[float], Optional[str]]:
+        price = self._to_float(meta.get("product:price:amount"))
+        sale_price = self._to_float(meta.get("product:sale_price:amount"))
+        currency = meta.get("product:price:currency") or None
 
         if price is not None:
             return price, sale_price, currency
 
-        price_node = soup.select_one(".product_price, .price .sell")
-        sale_node = soup.select_one(".price .strike")
+        price_node = self._SEL_PRICE.select_one(soup)
+        sale_node = self._SEL_SALE_PRICE.select_one(soup)
         return (
             self._to_float(price_node.get_text(strip=True) if price_node else None),
             self._to_float(sale_node.get_text(strip=True) if sale_node else None),
             currency,
         )
 
-    def _parse_images(self, soup: BeautifulSoup, base_url: str) -> tuple[Optional[str], list[str]]:
-        main_meta = soup.find("meta", property="og:image")
-        main = self._absolute(main_meta.get("content"), base_url) if main_meta and main_meta.get("content") else None
-        gallery_nodes = soup.select(".product_thumbs img, .xans-product-addimage img")
+    def _parse_images(
+        self, soup: BeautifulSoup, meta: Dict[str, str], base_url: str
+    ) -> tuple[Optional[str], list[str]]:
+        main = self._absolute(meta["og:image"], base_url) if meta.get("og:image") else None
+        gallery_nodes = self._SEL_GALLERY.select(soup)
         gallery = []
         for node in gallery_nodes:
             src = node.get("data-src") or node.get("src")
@@ -133,8 +159,7 @@ class Cafe24Parser:
                 gallery.append(self._absolute(src, base_url))
         return main, gallery
 
-    def _parse_detail_images(self, soup: BeautifulSoup, base_url: str) -> list[str]:
-        detail_section = soup.select_one("#prdDetail, .cont_detail, .productDetail")
+    def _parse_detail_images(self, detail_section: Optional[Tag], base_url: str) -> list[str]:
         if not detail_section:
             return []
         images = []
@@ -147,7 +172,7 @@ class Cafe24Parser:
     def _to_float(self, value: Optional[str]) -> Optional[float]:
         if not value:
             return None
-        cleaned = value.replace(",", "").replace("₩", "").strip()
+        cleaned = value.translate(_PRICE_STRIP)
         try:
             return float(cleaned)
         except ValueError:
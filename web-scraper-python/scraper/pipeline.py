@@ -2,38 +2,43 @@
 
 from __future__ import annotations
 
-import json
+import csv
 import logging
-import shutil
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
+import orjson
 
+from .archive import directory_members, write_zip
 from .client import Cafe24Client, RequestConfig
-from .images import ImageManager
+from .images import ImageDownloadResult, ImageManager
 from .ingest import InputLoader, ProductInput
 from .models import RawProductData, ShopifyRecord
 from .parser import Cafe24Parser
-from .transform import raw_to_shopify
-from .utils import slugify
+from .transform import product_handle, raw_to_shopify
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineSettings:
     input_path: Path
     output_dir: Path
     templates_dir: Path
     proxy_url: str | None = None
     captcha_key: str | None = None
+    http_cache_path: Path | None = None
+    http_cache_expire_seconds: int = 3600
     detail_template_name: str = "detail_header.png"
     zip_outputs: bool = True
     zip_images_name: str = "images.zip"
     zip_screenshots_name: str = "screenshots.zip"
+    # products processed concurrently; requests to one host are still paced by the client
+    max_workers: int = 8
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineResult:
     records: List[ShopifyRecord]
     failures: List[Dict[str, str]]
@@ -48,7 +53,13 @@ def run_pipeline(settings: PipelineSettings) -> PipelineResult:
     loader = InputLoader(settings.input_path)
     inputs = _dedupe_inputs(loader.load())
 
-    client = Cafe24Client(RequestConfig(proxy_url=settings.proxy_url))
+    client = Cafe24Client(
+        RequestConfig(
+            proxy_url=settings.proxy_url,
+            cache_path=settings.http_cache_path,
+            cache_expire_after=settings.http_cache_expire_seconds,
+        )
+    )
     parser = Cafe24Parser()
     image_manager = ImageManager(settings.output_dir / "images", settings.templates_dir)
 
@@ -57,23 +68,37 @@ def run_pipeline(settings: PipelineSettings) -> PipelineResult:
 
     logging.info("Processing %s product URLs", len(inputs))
 
-    for product in inputs:
-        try:
-            record = _process_single(
-                product,
-                client,
-                parser,
-                image_manager,
-                settings.output_dir,
-                settings.detail_template_name,
-            )
-            records.append(record)
-        except Exception as exc:  # pragma: no cover - to be caught in integration tests
-            logging.exception("Failed to process product", extra={"url": product.url})
-            failures.append({"url": product.url, "error": str(exc)})
-
     csv_path = settings.output_dir / "shopify_import.csv"
-    _export_csv(records, csv_path)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, settings.max_workers)) as executor:
+            futures = [
+                (
+                    product,
+                    executor.submit(
+                        _process_single,
+                        product,
+                        index,
+                        client,
+                        parser,
+                        image_manager,
+                        settings.output_dir,
+                        settings.detail_template_name,
+                    ),
+                )
+                for index, product in enumerate(inputs, start=1)
+            ]
+            # rows reach the CSV while later products are still being scraped
+            try:
+                _export_csv(_completed_records(futures, records, failures), csv_path)
+            except BaseException:
+                # drop the products still queued; otherwise leaving the block waits out every one of
+                # them (each paced by the rate limiter) before the error surfaces
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        # also on failure, so the worker pools and HTTP sessions never outlive the run
+        client.close()
+        image_manager.close()
 
     images_zip: Optional[Path] = None
     screenshots_zip: Optional[Path] = None
@@ -107,19 +132,34 @@ def run_pipeline(settings: PipelineSettings) -> PipelineResult:
     )
 
 
+def _completed_records(
+    futures: List[Tuple[ProductInput, Future]],
+    records: List[ShopifyRecord],
+    failures: List[Dict[str, str]],
+) -> Iterator[ShopifyRecord]:
+    # yield in input order so the CSV rows follow the input list regardless of finish order
+    for product, future in futures:
+        try:
+            record = future.result()
+        except Exception as exc:  # pragma: no cover - to be caught in integration tests
+            logging.exception("Failed to process product", extra={"url": product.url})
+            failures.append({"url": product.url, "error": str(exc)})
+            continue
+        records.append(record)
+        yield record
+
+
 def _dedupe_inputs(inputs: List[ProductInput]) -> List[ProductInput]:
-    seen = set()
-    deduped: List[ProductInput] = []
+    # dicts keep insertion order, and setdefault keeps the first item per URL in one lookup
+    seen: Dict[str, ProductInput] = {}
     for item in inputs:
-        if item.url in seen:
-            continue
-        deduped.append(item)
-        seen.add(item.url)
-    return deduped
+        seen.setdefault(item.url, item)
+    return list(seen.values())
 
 
 def _process_single(
     product: ProductInput,
+    index: int,
     client: Cafe24Client,
     parser: Cafe24Parser,
     image_manager: ImageManager,
@@ -129,87 +169,97 @@ def _process_single(
     response = client.fetch(product.url)
     raw: RawProductData = parser.parse(product.url, response.text)
 
-    prefix = slugify(raw.title or raw.sku or raw.source_url)
+    handle = product_handle(raw)
+    # products run concurrently and handles can collide (e.g. every Korean-only title slugifies to
+    # "product"), so the input position keeps each product's image files apart
+    image_prefix = f"{handle}-{index}"
+    root_prefix = os.path.join(os.fspath(output_root), "")
 
+    image_groups: Dict[str, List[str]] = {}
     if raw.main_image:
-        main_paths = _download_and_prepare(
+        image_groups["main"] = [raw.main_image]
+    if raw.gallery_images:
+        image_groups["gallery"] = raw.gallery_images
+    if raw.detail_images:
+        image_groups["detail"] = raw.detail_images
+    downloads = image_manager.download_groups(image_groups, image_prefix) if image_groups else {}
+
+    if "main" in downloads:
+        main_paths = _prepare_downloads(
             image_manager,
-            [raw.main_image],
-            prefix,
+            downloads["main"],
             "main",
-            output_root,
+            root_prefix,
             detail_template_name,
         )
         if main_paths:
             raw.main_image = main_paths[0]
 
-    if raw.gallery_images:
-        raw.gallery_images = _download_and_prepare(
+    if "gallery" in downloads:
+        raw.gallery_images = _prepare_downloads(
             image_manager,
-            raw.gallery_images,
-            prefix,
+            downloads["gallery"],
             "gallery",
-            output_root,
+            root_prefix,
             detail_template_name,
         )
 
-    if raw.detail_images:
-        raw.detail_images = _download_and_prepare(
+    if "detail" in downloads:
+        raw.detail_images = _prepare_downloads(
             image_manager,
-            raw.detail_images,
-            prefix,
+            downloads["detail"],
             "detail",
-            output_root,
+            root_prefix,
             detail_template_name,
         )
 
-    record = raw_to_shopify(raw)
+    record = raw_to_shopify(raw, handle=handle)
     return record
 
 
-def _download_and_prepare(
+def _prepare_downloads(
     image_manager: ImageManager,
-    urls: List[str],
-    prefix: str,
+    downloads: List[ImageDownloadResult],
     kind: str,
-    output_root: Path,
+    root_prefix: str,
     detail_template_name: str,
 ) -> List[str]:
-    downloads = image_manager.download_images(urls, prefix, kind)
-    prepared_paths: List[str] = []
-
-    for download in downloads:
-        target_path = download.path
-        if kind == "detail" and detail_template_name:
-            cropped = image_manager.crop_detail_image(download.path, detail_template_name)
-            if cropped:
-                target_path = cropped
-        image_manager.optimize_image(target_path)
-        prepared_paths.append(_relative(target_path, output_root))
-
-    return prepared_paths
-
-
-def _relative(path: Path, root: Path) -> str:
-    try:
-        return str(path.relative_to(root))
-    except ValueError:
-        return str(path)
-
-
-def _export_csv(records: List[ShopifyRecord], destination: Path) -> None:
-    rows: List[Dict[str, str]] = []
-    for record in records:
-        rows.extend(record.to_rows())
-
-    if not rows:
-        logging.warning("No records to export; writing empty CSV to %s", destination)
-        pd.DataFrame(columns=["Handle", "Title"]).to_csv(destination, index=False)
-        return
-
-    df = pd.DataFrame(rows)
-    df.to_csv(destination, index=False)
-    logging.info("Wrote Shopify CSV with %s rows", len(df))
+    # crop/resize is CPU-bound, so it runs on the manager's process pool rather than this thread
+    template_name = detail_template_name if kind == "detail" else None
+    prepared = image_manager.process_batch([download.path for download in downloads], template_name)
+    return [_relative(path, root_prefix) for path in prepared]
+
+
+def _relative(path: Path, root_prefix: str) -> str:
+    """Path relative to the output root (``root_prefix`` ends with a separator), else as given."""
+
+    path_str = os.fspath(path)
+    if path_str.startswith(root_prefix):
+        return path_str[len(root_prefix):]
+    return path_str
+
+
+def _export_csv(records: Iterable[ShopifyRecord], destination: Path) -> None:
+    row_count = 0
+    with destination.open("w", newline="", encoding="utf-8") as handle:
+        writer: Optional[csv.DictWriter] = None
+        # rows are written record by record, so only one record's rows are ever held at once
+        for record in records:
+            rows = record.to_rows()
+            if not rows:
+                continue
+            if writer is None:
+                # every ShopifyRecord row carries the same columns, so the first row fixes the header
+                writer = csv.DictWriter(handle, fieldnames=list(rows[0]), lineterminator="\n")
+                writer.writeheader()
+            writer.writerows(rows)
+            row_count += len(rows)
+
+        if writer is None:
+            logging.warning("No records to export; writing empty CSV to %s", destination)
+            handle.write("Handle,Title\n")
+            return
+    logging.info("Wrote Shopify CSV with %s rows", row_count)
 
 
 def _write_summary(
@@ -229,17 +279,19 @@ def _write_summary(
         summary["images_archive"] = str(images_zip)
     if screenshots_zip:
         summary["screenshots_archive"] = str(screenshots_zip)
-    path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     logging.info("Run summary saved to %s", path)
 
 
 def _zip_directory(source_dir: Path, destination: Path) -> Optional[Path]:
-    if not source_dir.exists() or not any(source_dir.iterdir()):
+    # a single scandir walk both lists the members and answers "is there anything to zip"
+    members = directory_members(source_dir)
+    if not members:
         logging.info("Zip skipped; directory empty", extra={"directory": str(source_dir)})
         return None
 
     destination.parent.mkdir(parents=True, exist_ok=True)
-    shutil.make_archive(str(destination.with_suffix("")), "zip", root_dir=source_dir)
     archive_path = destination if destination.suffix == ".zip" else destination.with_suffix(".zip")
+    write_zip(archive_path, members)
     logging.info("Created archive %s", archive_path)
     return archive_path
@@ -0,0 +1,99 @@
+"""Long-lived Puppeteer worker so scheduled runs reuse one Node process and browser."""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import IO, List, Optional
+
+import orjson
+
+EXIT_TIMEOUT_SECONDS = 30
+
+
+class PuppeteerWorker:
+    """Drives ``node scrape.js --daemon`` over a line-delimited JSON protocol on stdin/stdout.
+
+    The process (and its Chromium instance) is started on first use and restarted if it dies,
+    so only the first capture pays for Node and browser startup.
+    """
+
+    def __init__(self, node_bin: Path, script_path: Path) -> None:
+        self.node_bin = node_bin
+        self.script_path = script_path
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def capture(self, input_path: Path, output_dir: Path) -> List[Path]:
+        """Screenshot every URL in ``input_path`` into ``output_dir``; returns the saved files."""
+
+        request = orjson.dumps({"input": str(input_path), "output": str(output_dir)}) + b"\n"
+        with self._lock:
+            proc = self._ensure_started()
+            try:
+                proc.stdin.write(request)
+                proc.stdin.flush()
+                line = proc.stdout.readline()
+            except OSError:
+                line = b""
+            if not line:
+                self._discard(proc)
+                raise RuntimeError(f"Puppeteer worker exited unexpectedly (status {proc.poll()})")
+
+        response = orjson.loads(line)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return [Path(path) for path in response.get("paths", [])]
+
+    def close(self) -> None:
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.write(b'{"cmd": "exit"}\n')
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=EXIT_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def __enter__(self) -> "PuppeteerWorker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+
+        cmd = [str(self.node_bin), str(self.script_path), "--daemon"]
+        logging.info("Starting Puppeteer worker", extra={"command": " ".join(cmd)})
+        self._proc = subprocess.Popen(
+            cmd,
+            cwd=self.script_path.parent,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        # progress output arrives on stderr; drain it continuously so the pipe never fills up
+        threading.Thread(target=_log_output, args=(self._proc.stderr,), daemon=True).start()
+        return self._proc
+
+    def _discard(self, proc: subprocess.Popen) -> None:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        self._proc = None
+
+
+def _log_output(stream: IO[bytes]) -> None:
+    with stream:
+        for line in stream:
+            logging.info("puppeteer: %s", line.decode("utf-8", "replace").rstrip())
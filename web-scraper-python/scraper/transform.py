@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from .models import RawProductData, ShopifyImage, ShopifyRecord, ShopifyVariant
 from .utils import slugify
 
 
-def raw_to_shopify(raw: RawProductData) -> ShopifyRecord:
-    handle = slugify(raw.title or raw.sku or raw.source_url)
-    effective_price = raw.sale_price if raw.sale_price else raw.price or 0.0
-    compare_at = raw.price if raw.sale_price else raw.sale_price
+def product_handle(raw: RawProductData) -> str:
+    """Shopify handle for a product; also names its downloaded images."""
+
+    return slugify(raw.title or raw.sku or raw.source_url)
+
+
+def raw_to_shopify(raw: RawProductData, handle: Optional[str] = None) -> ShopifyRecord:
+    """Map scraped data onto a Shopify record; ``handle`` skips re-slugifying when already known."""
+
+    # fields read more than once below (the gallery loop reads the title per image)
+    title, price, sale_price = raw.title, raw.price, raw.sale_price
+
+    handle = handle or product_handle(raw)
+    effective_price = sale_price if sale_price else price or 0.0
+    compare_at = price if sale_price else sale_price
 
     variant = ShopifyVariant(
         sku=raw.sku or handle,
@@ -19,21 +30,20 @@ def raw_to_shopify(raw: RawProductData) -> ShopifyRecord:
         compare_at_price=compare_at,
     )
 
-    images: List[ShopifyImage] = []
-    if raw.main_image:
-        images.append(ShopifyImage(src=raw.main_image, position=1, alt_text=raw.title))
-    for idx, img in enumerate(raw.gallery_images, start=2):
-        images.append(ShopifyImage(src=img, position=idx, alt_text=raw.title))
+    # gallery positions start at 2 whether or not there is a main image
+    main_images = [ShopifyImage(src=raw.main_image, position=1, alt_text=title)] if raw.main_image else []
+    images: List[ShopifyImage] = main_images + [
+        ShopifyImage(src=img, position=idx, alt_text=title) for idx, img in enumerate(raw.gallery_images, start=2)
+    ]
 
-    body_html = raw.description_html or ""
-    if raw.detail_images:
-        body_html += "".join(
-            f'<p><img src="{src}" alt="{raw.title or handle}" /></p>' for src in raw.detail_images
-        )
+    body_parts = [raw.description_html or ""]
+    alt = title or handle
+    body_parts.extend(f'<p><img src="{src}" alt="{alt}" /></p>' for src in raw.detail_images)
+    body_html = "".join(body_parts)
 
     return ShopifyRecord(
         handle=handle,
-        title=raw.title or "Untitled Product",
+        title=title or "Untitled Product",
         body_html=body_html,
         vendor=raw.vendor or "Unknown",
         product_type=raw.product_type or "General",
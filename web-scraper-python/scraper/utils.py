@@ -2,19 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Iterable, List
 
 
-_SLUGIFY_PATTERN = re.compile(r"[^a-z0-9-]+")
+# any run of non-alphanumerics (spaces and dashes included) collapses to a single dash in one pass
+_SLUGIFY_PATTERN = re.compile(r"[^a-z0-9]+")
 
 
+@functools.lru_cache(maxsize=4096)
 def slugify(value: str) -> str:
-    value = (value or "").lower()
-    value = value.strip().replace(" ", "-")
-    value = _SLUGIFY_PATTERN.sub("-", value)
-    value = re.sub(r"-+", "-", value)
-    return value.strip("-") or "product"
+    return _SLUGIFY_PATTERN.sub("-", (value or "").lower()).strip("-") or "product"
 
 
 def split_tags(raw: str | Iterable[str] | None) -> List[str]:
@@ -1,8 +1,27 @@
 from __future__ import annotations
 
 import sys
+from importlib import import_module, reload
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture
+def app_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Import ``api.app`` against a throwaway input file and UI database."""
+
+    csv_stub = tmp_path / "stub.csv"
+    csv_stub.write_text("store_name,url\n", encoding="utf-8")
+    monkeypatch.setenv("SCRAPER_INPUT_URLS", str(csv_stub))
+    monkeypatch.setenv("SCRAPER_UI_DB_PATH", str(tmp_path / "ui_runs.db"))
+    monkeypatch.delenv("SCRAPER_UI_USERNAME", raising=False)
+    monkeypatch.delenv("SCRAPER_UI_PASSWORD", raising=False)
+    module_name = "api.app"
+    module = reload(sys.modules[module_name]) if module_name in sys.modules else import_module(module_name)
+    yield module
+    module.app.state.manager.shutdown()
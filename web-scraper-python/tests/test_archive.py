@@ -0,0 +1,53 @@
+import zipfile
+from pathlib import Path
+
+from scraper import archive
+from scraper.archive import write_zip
+
+
+def test_write_zip_keeps_member_order_and_contents(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(archive, "ARCHIVE_READAHEAD", 2)
+    monkeypatch.setattr(archive, "ARCHIVE_READAHEAD_MAX_BYTES", 1024)
+    sources = []
+    for idx in range(5):
+        path = tmp_path / f"file{idx}.txt"
+        # file4 is above the read-ahead limit and goes through the streaming path
+        path.write_text(str(idx) * (4096 if idx == 4 else 100), encoding="utf-8")
+        sources.append((path, f"nested/{path.name}"))
+    destination = tmp_path / "out.zip"
+
+    count = write_zip(destination, sources)
+
+    assert count == 5
+    with zipfile.ZipFile(destination) as result:
+        assert result.namelist() == [arcname for _, arcname in sources]
+        assert result.read("nested/file4.txt") == b"4" * 4096
+        assert result.read("nested/file1.txt") == b"1" * 100
+
+
+def test_write_zip_applies_compression_level(tmp_path: Path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(bytes(range(256)) * 400)
+
+    write_zip(tmp_path / "fast.zip", [(path, "notes.txt")], compresslevel=1)
+    write_zip(tmp_path / "best.zip", [(path, "notes.txt")], compresslevel=9)
+
+    with zipfile.ZipFile(tmp_path / "fast.zip") as fast, zipfile.ZipFile(tmp_path / "best.zip") as best:
+        assert fast.getinfo("notes.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert fast.read("notes.txt") == best.read("notes.txt")
+        assert fast.getinfo("notes.txt").compress_size != best.getinfo("notes.txt").compress_size
+
+
+def test_directory_members_walks_tree_once(tmp_path: Path):
+    from scraper.archive import directory_members
+
+    (tmp_path / "b" / "deep").mkdir(parents=True)
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "b" / "deep" / "c.jpg").write_bytes(b"c")
+
+    members = directory_members(tmp_path)
+
+    assert [arcname for _, arcname in members] == ["a.txt", "b/deep/c.jpg"]
+    assert members[1][0] == tmp_path / "b" / "deep" / "c.jpg"
+    assert directory_members(tmp_path / "missing") == []
@@ -0,0 +1,183 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from scraper.client import Cafe24Client, RateLimiter, RequestConfig, canonical_url
+
+
+def test_rate_limiter_spaces_requests_across_threads():
+    limiter = RateLimiter(base_delay=0.05, jitter=0.0)
+    stamps = []
+
+    def worker():
+        limiter.acquire()
+        stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stamps.sort()
+    assert stamps[2] - stamps[0] >= 0.09
+
+
+def test_rate_limiter_first_request_is_immediate():
+    limiter = RateLimiter(base_delay=10.0, jitter=0.0)
+
+    started = time.monotonic()
+    limiter.acquire()
+
+    assert time.monotonic() - started < 1.0
+
+
+def test_client_uses_one_limiter_per_host():
+    client = Cafe24Client(RequestConfig())
+
+    first = client._limiter_for("https://shop.example.com/product/1")
+    second = client._limiter_for("https://SHOP.example.com/product/2")
+    other = client._limiter_for("https://cdn.example.com/img.jpg")
+
+    assert first is second
+    assert first is not other
+
+
+def test_client_materializes_user_agents_once():
+    client = Cafe24Client(RequestConfig(user_agents=(agent for agent in ["agent-a", "agent-b"])))
+
+    picks = {client._choose_user_agent() for _ in range(50)}
+
+    assert picks <= {"agent-a", "agent-b"}
+    assert Cafe24Client(RequestConfig(user_agents=[]))._choose_user_agent()
+
+
+def test_client_revalidates_cached_pages_with_etag(tmp_path):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            body = b"<html>product</html>"
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/product/1"
+    config = RequestConfig(base_delay=0.0, jitter=0.0, cache_path=tmp_path / "http_cache.sqlite")
+    # separate clients, as in two runs: one client would answer the repeat from its in-memory memo
+    first_client, second_client = Cafe24Client(config), Cafe24Client(config)
+    try:
+        first = first_client.fetch(url)
+        second = second_client.fetch(url)
+    finally:
+        first_client.close()
+        second_client.close()
+        server.shutdown()
+
+    assert first.text == second.text == "<html>product</html>"
+    assert seen == [None, '"v1"']
+    assert second.from_cache
+
+
+def test_client_keeps_one_session_per_thread():
+    client = Cafe24Client(RequestConfig())
+    sessions = []
+
+    def worker():
+        sessions.append((client._session(), client._session()))
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(first is second for first, second in sessions)
+    assert sessions[0][0] is not sessions[1][0]
+    assert len(client._sessions) == 2
+    client.close()
+    assert client._sessions == []
+
+
+def test_canonical_url_ignores_case_slash_and_query_order():
+    assert canonical_url("HTTPS://Shop.Example.com/product/1/?b=2&a=1#reviews") == (
+        "https://shop.example.com/product/1?a=1&b=2"
+    )
+    assert canonical_url("https://shop.example.com") == "https://shop.example.com/"
+
+
+def test_client_memoizes_fetch_by_canonical_url(monkeypatch):
+    client = Cafe24Client(RequestConfig(base_delay=0.0, jitter=0.0))
+    calls = []
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            calls.append(url)
+            response = MagicMock()
+            response.url = url
+            return response
+
+    monkeypatch.setattr(client, "_session", lambda: FakeSession())
+
+    first = client.fetch("https://shop.example.com/product/1?b=2&a=1")
+    second = client.fetch("https://SHOP.example.com/product/1/?a=1&b=2")
+    other = client.fetch("https://shop.example.com/product/2")
+
+    assert first is second
+    assert other is not first
+    assert calls == ["https://shop.example.com/product/1?b=2&a=1", "https://shop.example.com/product/2"]
+
+
+def test_client_skips_rate_limit_for_fresh_cache_hits(tmp_path, monkeypatch):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    served = []
+    acquired = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            served.append(self.path)
+            body = b"<html>product</html>"
+            self.send_response(200)
+            self.send_header("Cache-Control", "max-age=600")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    monkeypatch.setattr(RateLimiter, "acquire", lambda self: acquired.append(self))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/product/1"
+    config = RequestConfig(cache_path=tmp_path / "http_cache.sqlite")
+    first_client, second_client = Cafe24Client(config), Cafe24Client(config)
+    try:
+        first_client.fetch(url)
+        cached = second_client.fetch(url)
+    finally:
+        first_client.close()
+        second_client.close()
+        server.shutdown()
+
+    assert cached.from_cache
+    assert served == ["/product/1"]
+    assert len(acquired) == 1
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, 99)),
+        ("bytes=-20", (80, 99)),
+        ("bytes=90-500", (90, 99)),
+        ("bytes=-500", (0, 99)),
+        ("items=0-9", None),
+        ("bytes=0-1,5-9", None),
+        ("bytes=9-0", None),
+        ("bytes=abc", None),
+    ],
+)
+def test_parse_range(app_module, header: str, expected) -> None:
+    assert app_module._parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=150-200", "bytes=-0"])
+def test_parse_range_unsatisfiable(app_module, header: str) -> None:
+    with pytest.raises(ValueError):
+        app_module._parse_range(header, 100)
+
+
+def test_iter_file_range_returns_requested_slice(app_module, tmp_path: Path) -> None:
+    payload = bytes(range(256)) * 1024
+    archive = tmp_path / "deliverables.zip"
+    archive.write_bytes(payload)
+
+    data = b"".join(app_module._iter_file_range(archive, 1000, 100_000))
+
+    assert data == payload[1000:100_001]
+
+
+def test_download_route_serves_byte_ranges(app_module, tmp_path: Path) -> None:
+    from fastapi.testclient import TestClient
+
+    payload = bytes(range(256)) * 4
+    archive = tmp_path / "deliverables.zip"
+    archive.write_bytes(payload)
+    store = app_module.app.state.manager.store
+    store.create_run(run_id="run1", input_path=tmp_path / "stub.csv", input_filename="stub.csv", source="upload")
+    store.mark_succeeded(
+        "run1",
+        output_dir=tmp_path,
+        csv_path=None,
+        summary_path=None,
+        images_zip_path=None,
+        screenshots_zip_path=None,
+        archive_path=archive,
+        log_path=None,
+    )
+
+    client = TestClient(app_module.app)
+    partial = client.get("/runs/run1/download", headers={"Range": "bytes=100-199"})
+    unsatisfiable = client.get("/runs/run1/download", headers={"Range": "bytes=5000-"})
+
+    assert partial.status_code == 206
+    assert partial.headers["content-range"] == f"bytes 100-199/{len(payload)}"
+    assert partial.content == payload[100:200]
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(payload)}"
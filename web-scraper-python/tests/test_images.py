@@ -0,0 +1,240 @@
+import io
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from scraper.images import ImageManager
+
+
+def _response(content: bytes) -> MagicMock:
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw = io.BytesIO(content)
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def test_download_images_preserves_order_and_skips_failures(tmp_path: Path):
+    manager = ImageManager(tmp_path / "images", tmp_path / "templates", max_workers=4)
+
+    def fake_get(url, timeout, stream):
+        if "broken" in url:
+            raise RuntimeError("boom")
+        return _response(url.encode("utf-8"))
+
+    manager._session.get = MagicMock(side_effect=fake_get)
+    urls = [f"https://cdn.example.com/{name}.jpg" for name in ("a", "b", "broken", "d")]
+
+    results = manager.download_images(urls, "sample", "gallery")
+
+    assert [result.source_url for result in results] == [urls[0], urls[1], urls[3]]
+    assert [result.path.name for result in results] == [
+        "sample_gallery_1.jpg",
+        "sample_gallery_2.jpg",
+        "sample_gallery_4.jpg",
+    ]
+    assert results[2].path.read_bytes() == urls[3].encode("utf-8")
+
+
+def test_download_groups_fetches_all_kinds_in_one_batch(tmp_path: Path):
+    import threading
+
+    manager = ImageManager(tmp_path / "images", tmp_path / "templates", max_workers=4)
+    # every download waits until all three are in flight, so this only finishes if the
+    # kinds are fetched as one concurrent batch rather than one kind after another
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_get(url, timeout, stream):
+        barrier.wait()
+        return _response(url.encode("utf-8"))
+
+    manager._session.get = MagicMock(side_effect=fake_get)
+    groups = {
+        "main": ["https://cdn.example.com/main.jpg"],
+        "gallery": ["https://cdn.example.com/g1.png"],
+        "detail": ["https://cdn.example.com/d1.jpg"],
+    }
+
+    results = manager.download_groups(groups, "sample")
+    manager.close()
+
+    assert {kind: [r.path.name for r in items] for kind, items in results.items()} == {
+        "main": ["sample_main_1.jpg"],
+        "gallery": ["sample_gallery_1.png"],
+        "detail": ["sample_detail_1.jpg"],
+    }
+
+
+def test_crop_detail_image_finds_template_header(tmp_path: Path):
+    import cv2
+    import numpy as np
+
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    rng = np.random.default_rng(0)
+    template = rng.integers(0, 256, size=(40, 200, 3), dtype=np.uint8)
+    cv2.imwrite(str(templates_dir / "header.png"), template)
+
+    page = np.full((900, 600, 3), 255, dtype=np.uint8)
+    page[:300] = rng.integers(0, 256, size=(300, 600, 3), dtype=np.uint8)
+    page[313:353, 57:257] = template
+    image_path = tmp_path / "detail.png"
+    cv2.imwrite(str(image_path), page)
+
+    manager = ImageManager(tmp_path / "images", templates_dir)
+    cropped_path = manager.crop_detail_image(image_path, "header.png", buffer_pixels=10)
+
+    assert cropped_path is not None
+    cropped = cv2.imread(str(cropped_path))
+    assert cropped.shape[0] == 900 - (313 + 40 + 10)
+
+
+def test_crop_detail_image_skips_when_template_absent(tmp_path: Path):
+    import cv2
+    import numpy as np
+
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    rng = np.random.default_rng(1)
+    cv2.imwrite(str(templates_dir / "header.png"), rng.integers(0, 256, size=(40, 200, 3), dtype=np.uint8))
+    image_path = tmp_path / "detail.png"
+    cv2.imwrite(str(image_path), rng.integers(0, 256, size=(400, 400, 3), dtype=np.uint8))
+
+    manager = ImageManager(tmp_path / "images", templates_dir)
+
+    assert manager.crop_detail_image(image_path, "header.png") is None
+
+
+def test_load_template_is_cached(tmp_path: Path):
+    import cv2
+    import numpy as np
+
+    from scraper.images import _load_template
+
+    template_path = tmp_path / "header.png"
+    cv2.imwrite(str(template_path), np.zeros((20, 40, 3), dtype=np.uint8))
+    mtime_ns = template_path.stat().st_mtime_ns
+
+    first = _load_template(str(template_path), mtime_ns)
+
+    assert first.shape == (20, 40)
+    assert _load_template(str(template_path), mtime_ns) is first
+
+
+def test_process_batch_returns_prepared_paths_in_order(tmp_path: Path):
+    from PIL import Image
+
+    manager = ImageManager(tmp_path / "images", tmp_path / "templates", process_workers=2)
+    paths = []
+    for idx, width in enumerate((1600, 800, 2400), start=1):
+        path = tmp_path / "images" / f"sample_gallery_{idx}.jpg"
+        Image.new("RGB", (width, 100), color="white").save(path)
+        paths.append(path)
+
+    prepared = manager.process_batch(paths, max_width=1200)
+    again = manager.process_batch(paths[:2], max_width=1000)
+    pool = manager._process_executor
+    manager.close()
+
+    assert pool is not None and manager._process_executor is None
+    assert again == paths[:2]
+
+    assert prepared == paths
+    with Image.open(prepared[0]) as img:
+        assert img.width == 1000
+    with Image.open(prepared[1]) as img:
+        assert img.width == 800
+    with Image.open(prepared[2]) as img:
+        assert img.width == 1200
+
+
+def test_optimize_image_resizes_jpeg_and_png(tmp_path: Path):
+    from PIL import Image
+
+    manager = ImageManager(tmp_path / "images", tmp_path / "templates")
+    jpeg_path = tmp_path / "wide.jpg"
+    png_path = tmp_path / "wide.png"
+    Image.new("RGB", (2400, 600), color="red").save(jpeg_path)
+    Image.new("RGBA", (2400, 600), color=(0, 0, 255, 128)).save(png_path)
+
+    manager.optimize_image(jpeg_path, max_width=1200)
+    manager.optimize_image(png_path, max_width=1200)
+
+    with Image.open(jpeg_path) as img:
+        assert (img.format, img.size) == ("JPEG", (1200, 300))
+    with Image.open(png_path) as img:
+        assert (img.mode, img.size) == ("RGBA", (1200, 300))
+
+
+def test_optimize_image_skips_decode_for_small_images(tmp_path: Path, monkeypatch):
+    from PIL import Image, ImageFile
+
+    manager = ImageManager(tmp_path / "images", tmp_path / "templates")
+    path = tmp_path / "small.jpg"
+    Image.new("RGB", (800, 600), color="white").save(path)
+    before = path.read_bytes()
+
+    def fail_load(self):
+        raise AssertionError("pixel data should not be decoded")
+
+    monkeypatch.setattr(ImageFile.ImageFile, "load", fail_load)
+    manager.optimize_image(path, max_width=1200)
+
+    assert path.read_bytes() == before
+
+
+def test_process_batch_keeps_original_for_unreadable_image(tmp_path: Path):
+    manager = ImageManager(tmp_path / "images", tmp_path / "templates")
+    bad = tmp_path / "images" / "bad_main_1.jpg"
+    bad.write_bytes(b"<html>not an image</html>")
+
+    assert manager.process_batch([bad]) == [bad]
+    manager.close()
+
+
+def test_process_batch_recovers_from_broken_pool(tmp_path: Path):
+    import os
+    from concurrent.futures.process import BrokenProcessPool
+
+    import pytest
+    from PIL import Image
+
+    manager = ImageManager(tmp_path / "images", tmp_path / "templates", process_workers=2)
+    paths = []
+    for idx in (1, 2):
+        path = tmp_path / "images" / f"sample_gallery_{idx}.jpg"
+        Image.new("RGB", (1600, 100), color="white").save(path)
+        paths.append(path)
+
+    broken = manager._process_pool()
+    with pytest.raises(BrokenProcessPool):
+        broken.submit(os._exit, 1).result()
+
+    try:
+        assert manager.process_batch(paths, max_width=1200) == paths
+        assert manager._process_executor is None
+        assert manager.process_batch(paths, max_width=1000) == paths
+        assert manager._process_executor not in (None, broken)
+    finally:
+        manager.close()
+
+    with Image.open(paths[0]) as img:
+        assert img.width == 1000
+
+
+def test_process_batch_forwards_worker_logs(tmp_path: Path, caplog):
+    import logging
+
+    from PIL import Image
+
+    manager = ImageManager(tmp_path / "images", tmp_path / "templates", process_workers=2)
+    paths = []
+    for idx in (1, 2):
+        path = tmp_path / "images" / f"sample_detail_{idx}.jpg"
+        Image.new("RGB", (100, 100), color="white").save(path)
+        paths.append(path)
+
+    with caplog.at_level(logging.INFO):
+        assert manager.process_batch(paths, "missing_header.png") == paths
+        manager.close()
+
+    assert [record.message for record in caplog.records].count("Template missing, skipping crop") == 2
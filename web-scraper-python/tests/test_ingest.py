@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from scraper.ingest import InputLoader
+
+
+def test_load_csv_reads_url_column(tmp_path: Path):
+    path = tmp_path / "urls.csv"
+    path.write_text(
+        "store_name,url\njolse,https://jolse.com/product/1\nempty,\nshort\njolse, https://jolse.com/product/2 \n",
+        encoding="utf-8-sig",
+    )
+
+    urls = [item.url for item in InputLoader(path).load()]
+
+    assert urls == ["https://jolse.com/product/1", "https://jolse.com/product/2"]
+
+
+def test_load_csv_requires_url_column(tmp_path: Path):
+    path = tmp_path / "urls.csv"
+    path.write_text("store_name,link\njolse,https://jolse.com/product/1\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        InputLoader(path).load()
+
+
+def test_load_json_accepts_strings_and_objects(tmp_path: Path):
+    path = tmp_path / "urls.json"
+    path.write_text(
+        '["https://jolse.com/product/1", {"url": " https://jolse.com/product/2 "}, {"name": "no url"}]',
+        encoding="utf-8",
+    )
+
+    urls = [item.url for item in InputLoader(path).load()]
+
+    assert urls == ["https://jolse.com/product/1", "https://jolse.com/product/2"]
+
+
+def test_load_json_rejects_non_list(tmp_path: Path):
+    path = tmp_path / "urls.json"
+    path.write_text('{"url": "https://jolse.com/product/1"}', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        InputLoader(path).load()
@@ -0,0 +1,37 @@
+from scraper.models import ShopifyImage, ShopifyRecord, ShopifyVariant
+
+
+def _record(**overrides) -> ShopifyRecord:
+    values = dict(
+        handle="sample",
+        title="Sample",
+        body_html="<p>Body</p>",
+        vendor="Vendor",
+        product_type="Skincare",
+        tags=["a", "b"],
+        published=True,
+        variants=[ShopifyVariant(sku="SKU1", price=9.0, compare_at_price=18.0)],
+        images=[ShopifyImage(src="images/main.jpg", position=1, alt_text="Sample")],
+    )
+    values.update(overrides)
+    return ShopifyRecord(**values)
+
+
+def test_to_rows_merges_base_variant_and_image_columns():
+    rows = _record().to_rows()
+
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["Handle"] == "sample"
+    assert row["Tags"] == "a,b"
+    assert row["Variant Price"] == "9.00"
+    assert row["Variant Compare At Price"] == "18.00"
+    assert row["Image Src"] == "images/main.jpg"
+
+
+def test_to_rows_without_variants_uses_defaults():
+    rows = _record(variants=[], images=[]).to_rows()
+
+    assert rows[0]["Variant SKU"] == ""
+    assert rows[0]["Image Src"] == ""
+    assert rows[0]["Published"] == "TRUE"
@@ -38,3 +38,13 @@ def test_parser_extracts_jolse_fields():
     assert result.main_image and result.main_image.startswith("https://")
     assert result.detail_images
     assert all(img.startswith("http") for img in result.detail_images)
+
+
+def test_to_float_strips_currency_and_separators():
+    parser = Cafe24Parser()
+
+    assert parser._to_float(" ₩12,000\n") == 12000.0
+    assert parser._to_float("￦8,990") == 8990.0
+    assert parser._to_float("18.00") == 18.0
+    assert parser._to_float("sold out") is None
+    assert parser._to_float(None) is None
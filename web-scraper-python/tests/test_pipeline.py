@@ -1,12 +1,14 @@
 """Tests for pipeline CSV export behavior."""
 
+import json
 import logging
+import zipfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pandas as pd
 
-from scraper.pipeline import PipelineResult, _export_csv, _zip_directory
+from scraper.pipeline import PipelineResult, _export_csv, _relative, _write_summary, _zip_directory
 
 
 def test_export_csv_writes_rows(tmp_path: Path):
@@ -26,9 +28,34 @@ def test_export_csv_writes_rows(tmp_path: Path):
 
 def test_export_csv_empty(tmp_path: Path):
     destination = tmp_path / "shopify.csv"
-    with patch("pandas.DataFrame.to_csv") as mock_to_csv:
-        _export_csv([], destination)
-        assert mock_to_csv.called
+    _export_csv([], destination)
+    assert destination.read_text(encoding="utf-8") == "Handle,Title\n"
+
+
+def test_export_csv_matches_shopify_record_rows(tmp_path: Path):
+    from scraper.models import ShopifyImage, ShopifyRecord, ShopifyVariant
+
+    record = ShopifyRecord(
+        handle="sample",
+        title='Cream, "rich"',
+        body_html="<p>line\nbreak</p>",
+        vendor=None,
+        product_type="Skincare",
+        tags=["a"],
+        published=True,
+        variants=[ShopifyVariant(sku="SKU1", price=9.5, compare_at_price=None)],
+        images=[ShopifyImage(src="images/main.jpg", position=1)],
+    )
+    destination = tmp_path / "shopify.csv"
+
+    _export_csv([record], destination)
+
+    df = pd.read_csv(destination, keep_default_na=False)
+    assert list(df.columns) == list(record.to_rows()[0])
+    assert df.loc[0, "Title"] == 'Cream, "rich"'
+    assert df.loc[0, "Body (HTML)"] == "<p>line\nbreak</p>"
+    assert df.loc[0, "Vendor"] == ""
+    assert df.loc[0, "Variant Price"] == 9.5
 
 
 def test_zip_directory_creates_archive(tmp_path: Path):
@@ -50,3 +77,215 @@ def test_zip_directory_skips_empty(tmp_path: Path, caplog):
 
     assert archive_path is None
     assert "Zip skipped" in caplog.text
+
+
+def test_zip_directory_stores_compressed_images(tmp_path: Path):
+    assets_dir = tmp_path / "images"
+    (assets_dir / "nested").mkdir(parents=True)
+    (assets_dir / "main.JPG").write_bytes(b"\xff\xd8" + b"\x00" * 2048)
+    (assets_dir / "nested" / "notes.txt").write_text("a" * 2048, encoding="utf-8")
+
+    archive_path = _zip_directory(assets_dir, tmp_path / "images.zip")
+
+    with zipfile.ZipFile(archive_path) as archive:
+        infos = {info.filename: info for info in archive.infolist()}
+        assert infos["main.JPG"].compress_type == zipfile.ZIP_STORED
+        assert infos["nested/notes.txt"].compress_type == zipfile.ZIP_DEFLATED
+        assert archive.read("nested/notes.txt") == b"a" * 2048
+
+
+def test_run_pipeline_processes_products_concurrently_in_input_order(tmp_path: Path, monkeypatch):
+    import threading
+    import time
+
+    from scraper import pipeline
+
+    urls = [f"https://shop.example.com/product/{idx}" for idx in range(4)]
+    input_path = tmp_path / "urls.csv"
+    input_path.write_text("url\n" + "\n".join(urls) + "\n", encoding="utf-8")
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_process_single(product, *args):
+        with lock:
+            active.append(product.url)
+            peak.append(len(active))
+        time.sleep(0.05 * (4 - urls.index(product.url)))
+        with lock:
+            active.remove(product.url)
+        if product.url.endswith("/2"):
+            raise RuntimeError("boom")
+        record = MagicMock()
+        record.url = product.url
+        record.to_rows.return_value = []
+        return record
+
+    monkeypatch.setattr(pipeline, "_process_single", fake_process_single)
+    settings = pipeline.PipelineSettings(
+        input_path=input_path,
+        output_dir=tmp_path / "out",
+        templates_dir=tmp_path / "templates",
+        zip_outputs=False,
+        max_workers=4,
+    )
+
+    result = pipeline.run_pipeline(settings)
+
+    assert [record.url for record in result.records] == [urls[0], urls[1], urls[3]]
+    assert result.failures == [{"url": urls[2], "error": "boom"}]
+    assert max(peak) > 1
+
+
+def test_export_csv_streams_records(tmp_path: Path):
+    consumed = []
+
+    class DummyRecord:
+        def __init__(self, handle):
+            self.handle = handle
+
+        def to_rows(self):
+            consumed.append(self.handle)
+            return [{"Handle": self.handle, "Title": self.handle.title()}]
+
+    def records():
+        for handle in ("a", "b"):
+            yield DummyRecord(handle)
+
+    destination = tmp_path / "shopify.csv"
+    _export_csv(records(), destination)
+
+    assert consumed == ["a", "b"]
+    assert destination.read_text(encoding="utf-8") == "Handle,Title\na,A\nb,B\n"
+
+
+def test_dedupe_inputs_keeps_first_occurrence_in_order():
+    from scraper.ingest import ProductInput
+    from scraper.pipeline import _dedupe_inputs
+
+    first = ProductInput(url="https://shop.example.com/a")
+    items = [first, ProductInput(url="https://shop.example.com/b"), ProductInput(url="https://shop.example.com/a")]
+
+    deduped = _dedupe_inputs(items)
+
+    assert [item.url for item in deduped] == ["https://shop.example.com/a", "https://shop.example.com/b"]
+    assert deduped[0] is first
+
+
+def test_write_summary_is_indented_utf8_json(tmp_path: Path):
+    path = tmp_path / "run_summary.json"
+    failures = [{"url": "https://jolse.com/product/1", "error": "품절"}]
+
+    _write_summary(path, [], failures, images_zip=tmp_path / "images.zip")
+
+    text = path.read_text(encoding="utf-8")
+    assert "품절" in text
+    assert text.startswith('{\n  "success_count": 0,')
+    assert json.loads(text) == {
+        "success_count": 0,
+        "failure_count": 1,
+        "failures": failures,
+        "images_archive": str(tmp_path / "images.zip"),
+    }
+
+
+def test_relative_strips_output_root_prefix(tmp_path: Path):
+    root_prefix = str(tmp_path / "out") + "/"
+
+    assert _relative(tmp_path / "out" / "images" / "a.jpg", root_prefix) == "images/a.jpg"
+    assert _relative(tmp_path / "outside" / "a.jpg", root_prefix) == str(tmp_path / "outside" / "a.jpg")
+    assert _relative(tmp_path / "output" / "a.jpg", root_prefix) == str(tmp_path / "output" / "a.jpg")
+
+
+def test_process_single_keeps_image_files_apart_for_colliding_handles(tmp_path: Path):
+    from scraper import pipeline
+    from scraper.models import RawProductData
+
+    parser = MagicMock()
+    parser.parse.side_effect = lambda url, html: RawProductData(
+        source_url=url, title="설화수 윤조에센스", main_image=url + "/main.jpg"
+    )
+    image_manager = MagicMock()
+    image_manager.download_groups.return_value = {}
+
+    records = [
+        pipeline._process_single(
+            pipeline.ProductInput(url=f"https://shop.example.com/product/{index}"),
+            index,
+            MagicMock(),
+            parser,
+            image_manager,
+            tmp_path,
+            "detail_header.png",
+        )
+        for index in (1, 2)
+    ]
+
+    prefixes = [call.args[1] for call in image_manager.download_groups.call_args_list]
+    assert prefixes == ["product-1", "product-2"]
+    assert [record.handle for record in records] == ["product", "product"]
+
+
+def test_run_pipeline_closes_resources_when_export_fails(tmp_path: Path, monkeypatch):
+    import pytest
+
+    from scraper import pipeline
+
+    input_path = tmp_path / "urls.csv"
+    input_path.write_text("url\nhttps://shop.example.com/product/1\n", encoding="utf-8")
+    client = MagicMock()
+    image_manager = MagicMock()
+    monkeypatch.setattr(pipeline, "Cafe24Client", lambda config: client)
+    monkeypatch.setattr(pipeline, "ImageManager", lambda *args: image_manager)
+    monkeypatch.setattr(pipeline, "_process_single", lambda product, *args: MagicMock())
+    monkeypatch.setattr(pipeline, "_export_csv", MagicMock(side_effect=OSError("disk full")))
+    settings = pipeline.PipelineSettings(
+        input_path=input_path,
+        output_dir=tmp_path / "out",
+        templates_dir=tmp_path / "templates",
+    )
+
+    with pytest.raises(OSError):
+        pipeline.run_pipeline(settings)
+
+    client.close.assert_called_once()
+    image_manager.close.assert_called_once()
+
+
+def test_run_pipeline_fails_fast_when_export_fails(tmp_path: Path, monkeypatch):
+    import time
+
+    import pytest
+
+    from scraper import pipeline
+
+    input_path = tmp_path / "urls.csv"
+    input_path.write_text(
+        "url\n" + "".join(f"https://shop.example.com/product/{idx}\n" for idx in range(40)),
+        encoding="utf-8",
+    )
+    processed = []
+
+    def slow_process_single(product, *args):
+        time.sleep(0.1)
+        processed.append(product.url)
+        return MagicMock()
+
+    monkeypatch.setattr(pipeline, "Cafe24Client", lambda config: MagicMock())
+    monkeypatch.setattr(pipeline, "ImageManager", lambda *args: MagicMock())
+    monkeypatch.setattr(pipeline, "_process_single", slow_process_single)
+    monkeypatch.setattr(pipeline, "_export_csv", MagicMock(side_effect=OSError("disk full")))
+    settings = pipeline.PipelineSettings(
+        input_path=input_path,
+        output_dir=tmp_path / "out",
+        templates_dir=tmp_path / "templates",
+        max_workers=2,
+    )
+
+    started = time.monotonic()
+    with pytest.raises(OSError):
+        pipeline.run_pipeline(settings)
+
+    # only the products already in flight finish; the other 38 are cancelled
+    assert time.monotonic() - started < 1.0
+    assert len(processed) <= 2
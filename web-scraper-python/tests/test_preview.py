@@ -1,27 +1,11 @@
 from __future__ import annotations
 
-from importlib import import_module, reload
 import os
 from pathlib import Path
-import sys
 
 
-def _load_helper(tmp_path: Path):
-    csv_stub = tmp_path / "stub.csv"
-    csv_stub.write_text("store_name,url\n", encoding="utf-8")
-    os.environ["SCRAPER_INPUT_URLS"] = str(csv_stub)
-    os.environ["SCRAPER_UI_DB_PATH"] = str(tmp_path / "ui_runs.db")
-    # ensure module reflects latest env
-    module_name = "api.app"
-    if module_name in sys.modules:
-        module = reload(sys.modules[module_name])
-    else:
-        module = import_module(module_name)
-    return module._load_preview_rows  # type: ignore[attr-defined]
-
-
-def test_load_preview_rows_limits_and_deduplicates(tmp_path: Path) -> None:
-    _load_preview_rows = _load_helper(tmp_path)
+def test_load_preview_rows_limits_and_deduplicates(app_module, tmp_path: Path) -> None:
+    _load_preview_rows = app_module._load_preview_rows
 
     csv_path = tmp_path / "shopify_import.csv"
     csv_path.write_text(
@@ -41,8 +25,8 @@ handle-3,Product Three,<p>HTML 3</p>
     assert previews[0]["body_html"] == "<p>HTML 1</p>"
     assert previews[1]["handle"] == "handle-2"
 
-def test_load_preview_rows_returns_all_if_under_limit(tmp_path: Path) -> None:
-    _load_preview_rows = _load_helper(tmp_path)
+def test_load_preview_rows_returns_all_if_under_limit(app_module, tmp_path: Path) -> None:
+    _load_preview_rows = app_module._load_preview_rows
 
     csv_path = tmp_path / "shopify_import.csv"
     csv_path.write_text(
@@ -57,3 +41,49 @@ handle-1,Product One,<p>HTML 1</p>
     assert len(previews) == 1
     assert previews[0]["title"] == "Product One"
     assert previews[0]["body_html"] == "<p>HTML 1</p>"
+
+
+def test_load_preview_rows_tolerates_missing_columns(app_module, tmp_path: Path) -> None:
+    _load_preview_rows = app_module._load_preview_rows
+
+    csv_path = tmp_path / "shopify_import.csv"
+    csv_path.write_text(
+        """Handle,Title
+handle-1,Product One
+handle-2
+""",
+        encoding="utf-8",
+    )
+
+    previews = _load_preview_rows(csv_path, limit=5)
+
+    assert [preview["handle"] for preview in previews] == ["handle-1", "handle-2"]
+    assert previews[0]["body_html"] == ""
+    assert previews[1]["title"] == ""
+
+
+def test_load_preview_rows_strips_utf8_bom(app_module, tmp_path: Path) -> None:
+    _load_preview_rows = app_module._load_preview_rows
+
+    csv_path = tmp_path / "shopify_import.csv"
+    csv_path.write_text("Handle,Title,Body (HTML)\nhandle-1,제품,<p>본문</p>\n", encoding="utf-8-sig")
+
+    previews = _load_preview_rows(csv_path, limit=3)
+
+    assert previews == [{"handle": "handle-1", "title": "제품", "body_html": "<p>본문</p>"}]
+
+
+def test_cached_preview_rows_refreshes_when_file_changes(app_module, tmp_path: Path) -> None:
+    module = app_module
+
+    csv_path = tmp_path / "shopify_import.csv"
+    csv_path.write_text("Handle,Title,Body (HTML)\nhandle-1,Product One,<p>1</p>\n", encoding="utf-8")
+
+    first = module._cached_preview_rows(csv_path, 3)
+    first[0]["title"] = "mutated"
+    assert module._cached_preview_rows(csv_path, 3)[0]["title"] == "Product One"
+
+    csv_path.write_text("Handle,Title,Body (HTML)\nhandle-2,Product Two,<p>2</p>\n", encoding="utf-8")
+    os.utime(csv_path, ns=(0, csv_path.stat().st_mtime_ns + 1_000_000))
+
+    assert module._cached_preview_rows(csv_path, 3)[0]["handle"] == "handle-2"
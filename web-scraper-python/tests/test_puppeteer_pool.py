@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from scraper.puppeteer_pool import PuppeteerWorker
+
+FAKE_DAEMON = """
+import json, os, sys
+assert sys.argv[1] == "--daemon"
+sys.stderr.write("browser ready\\n")
+sys.stderr.flush()
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get("cmd") == "exit":
+        break
+    if request["input"].endswith("bad.csv"):
+        print(json.dumps({"error": "cannot read input"}), flush=True)
+    elif request["input"].endswith("crash.csv"):
+        sys.exit(2)
+    else:
+        path = os.path.join(request["output"], "shop-full.png")
+        print(json.dumps({"paths": [path], "pid": os.getpid()}), flush=True)
+"""
+
+
+@pytest.fixture()
+def worker(tmp_path: Path):
+    script = tmp_path / "scrape.js"
+    script.write_text(FAKE_DAEMON, encoding="utf-8")
+    with PuppeteerWorker(Path(sys.executable), script) as instance:
+        yield instance
+
+
+def test_worker_reuses_one_process_across_captures(worker: PuppeteerWorker, tmp_path: Path):
+    first = worker.capture(tmp_path / "urls.csv", tmp_path / "run1")
+    process = worker._proc
+    second = worker.capture(tmp_path / "urls.csv", tmp_path / "run2")
+
+    assert first == [tmp_path / "run1" / "shop-full.png"]
+    assert second == [tmp_path / "run2" / "shop-full.png"]
+    assert worker._proc is process
+
+
+def test_worker_reports_errors_and_restarts_after_crash(worker: PuppeteerWorker, tmp_path: Path):
+    with pytest.raises(RuntimeError, match="cannot read input"):
+        worker.capture(tmp_path / "bad.csv", tmp_path / "out")
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        worker.capture(tmp_path / "crash.csv", tmp_path / "out")
+
+    assert worker.capture(tmp_path / "urls.csv", tmp_path / "out") == [tmp_path / "out" / "shop-full.png"]
+
+
+def test_close_stops_the_process(worker: PuppeteerWorker, tmp_path: Path):
+    worker.capture(tmp_path / "urls.csv", tmp_path / "out")
+    process = worker._proc
+
+    worker.close()
+
+    assert process.returncode == 0
+    assert worker._proc is None
@@ -124,3 +124,79 @@ async def test_run_background_sets_archive_path(tmp_path: Path) -> None:
     assert final_call.args[1].name == "deliverables.zip"
     assert final_call.args[1].parent == output_dir
     store.mark_succeeded.assert_called_once()
+
+
+def test_prepare_archive_stores_compressed_payloads(tmp_path: Path) -> None:
+    import zipfile
+
+    settings = Settings(input_urls_path=tmp_path / "urls.csv")
+    manager = RunManager(settings=settings, store=MagicMock())
+
+    output_dir = tmp_path / "run"
+    (output_dir / "images").mkdir(parents=True)
+    (output_dir / "shopify_import.csv").write_text("Handle,Title\n" * 50, encoding="utf-8")
+    (output_dir / "images" / "main.jpg").write_bytes(b"\xff\xd8" + b"\x00" * 512)
+    with zipfile.ZipFile(output_dir / "images.zip", "w") as nested:
+        nested.writestr("main.jpg", b"\xff\xd8")
+
+    archive_path = manager._prepare_archive(output_dir)
+    manager.shutdown()
+
+    assert archive_path == output_dir / "deliverables.zip"
+    with zipfile.ZipFile(archive_path) as archive:
+        infos = {info.filename: info for info in archive.infolist()}
+    assert set(infos) == {"images.zip", "images/main.jpg", "shopify_import.csv"}
+    assert infos["images.zip"].compress_type == zipfile.ZIP_STORED
+    assert infos["images/main.jpg"].compress_type == zipfile.ZIP_STORED
+    assert infos["shopify_import.csv"].compress_type == zipfile.ZIP_DEFLATED
+
+
+@pytest.mark.asyncio
+async def test_run_background_runs_one_at_a_time(tmp_path: Path) -> None:
+    import asyncio
+
+    settings = Settings(input_urls_path=tmp_path / "urls.csv")
+    manager = RunManager(settings=settings, store=MagicMock())
+
+    active = 0
+    peak = 0
+
+    async def fake_execute_run(run_id, input_path):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return None
+
+    manager._execute_run = fake_execute_run  # type: ignore
+    await asyncio.gather(*(manager._run_background(str(idx), tmp_path) for idx in range(5)))
+    manager.shutdown()
+
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_run_background_starts_next_pipeline_while_archiving(tmp_path: Path) -> None:
+    import asyncio
+
+    settings = Settings(input_urls_path=tmp_path / "urls.csv")
+    manager = RunManager(settings=settings, store=MagicMock())
+    second_started = asyncio.Event()
+
+    async def fake_execute_run(run_id, input_path):
+        if run_id == "second":
+            second_started.set()
+        return MagicMock(), MagicMock()
+
+    async def fake_finalize_run(run_id, pipeline_settings, result):
+        if run_id == "first":
+            # the first run's archive step only finishes once the second pipeline is running
+            await asyncio.wait_for(second_started.wait(), timeout=1)
+
+    manager._execute_run = fake_execute_run  # type: ignore
+    manager._finalize_run = fake_finalize_run  # type: ignore
+    await asyncio.gather(manager._run_background("first", tmp_path), manager._run_background("second", tmp_path))
+    manager.shutdown()
+
+    assert second_started.is_set()
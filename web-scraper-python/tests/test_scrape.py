@@ -0,0 +1,74 @@
+import logging
+import sys
+from logging.handlers import QueueHandler
+from pathlib import Path
+from types import SimpleNamespace
+
+import scrape
+
+
+def test_configure_logging_writes_through_queue_listener(tmp_path: Path):
+    settings = SimpleNamespace(logs_root=tmp_path)
+
+    scrape.configure_logging(settings, "first")
+    logging.info("hello %s", "queue")
+    scrape.configure_logging(settings, "second")
+    logging.warning("switched")
+    scrape.stop_logging()
+
+    assert "[INFO] hello queue" in (tmp_path / "scraper-first.log").read_text(encoding="utf-8")
+    second = (tmp_path / "scraper-second.log").read_text(encoding="utf-8")
+    assert "[WARNING] switched" in second
+    assert "hello queue" not in second
+    assert not any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers)
+
+
+def test_run_log_is_buffered_until_flushed(tmp_path: Path):
+    settings = SimpleNamespace(logs_root=tmp_path)
+    log_file = tmp_path / "scraper-buffered.log"
+
+    scrape.configure_logging(settings, "buffered")
+    logging.info("first line")
+    scrape.flush_logging()
+    assert "first line" in log_file.read_text(encoding="utf-8")
+
+    logging.info("second line")
+    logging.error("boom")
+    scrape.flush_logging()
+    scrape.stop_logging()
+
+    content = log_file.read_text(encoding="utf-8")
+    assert content.index("second line") < content.index("[ERROR] boom")
+
+
+def test_buffered_file_handler_flushes_on_error(tmp_path: Path):
+    log_file = tmp_path / "direct.log"
+    handler = scrape.BufferedFileHandler(log_file)
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "quiet", None, None)
+
+    assert not log_file.exists()
+    handler.emit(record)
+    assert log_file.read_text(encoding="utf-8") == ""
+
+    record.levelno = logging.ERROR
+    handler.emit(record)
+    assert log_file.read_text(encoding="utf-8") == "quiet\nquiet\n"
+    handler.close()
+
+
+def test_puppeteer_output_is_streamed_to_log(tmp_path: Path, caplog):
+    script = tmp_path / "scrape.js"
+    script.write_text("import sys\nprint('captured 2 pages')\nsys.exit(3)\n", encoding="utf-8")
+    settings = SimpleNamespace(
+        puppeteer_enabled=True,
+        puppeteer_script=script,
+        puppeteer_bin=Path(sys.executable),
+        puppeteer_output_dir=None,
+        input_urls_path=tmp_path / "urls.csv",
+    )
+
+    with caplog.at_level(logging.INFO):
+        scrape._maybe_run_puppeteer(settings, tmp_path)
+
+    assert "puppeteer: captured 2 pages" in caplog.text
+    assert any(record.levelno == logging.ERROR for record in caplog.records)
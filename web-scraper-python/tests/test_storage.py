@@ -1,3 +1,4 @@
+import sqlite3
 import tempfile
 from pathlib import Path
 
@@ -55,7 +56,132 @@ def test_mark_transitions(temp_db: Path) -> None:
     )
     record = store.get_run("abc")
     assert record.status == RunStatus.SUCCEEDED
-    assert record.csv_path == csv_path
+    assert record.csv_path == csv_path_str
 
     store.mark_failed("abc", "boom")
     assert store.get_run("abc").status == RunStatus.FAILED
+
+
+def test_store_uses_wal_journal(temp_db: Path) -> None:
+    store = RunStore(temp_db)
+    store.initialize()
+    store.create_run(run_id="wal", input_path=Path("/tmp/foo.csv"), input_filename="foo.csv", source="upload")
+
+    reader = RunStore(temp_db)
+    journal_mode = reader._conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert journal_mode == "wal"
+    assert reader.get_run("wal") is not None
+    reader.close()
+    store.close()
+
+
+def test_list_runs_orders_newest_first(temp_db: Path) -> None:
+    store = RunStore(temp_db)
+    store.initialize()
+    for run_id in ("first", "second", "third"):
+        store.create_run(run_id=run_id, input_path=Path("/tmp/foo.csv"), input_filename="foo.csv", source="upload")
+
+    plan = store._conn.execute("EXPLAIN QUERY PLAN SELECT * FROM runs ORDER BY created_at DESC LIMIT 2").fetchall()
+
+    assert [run.id for run in store.list_runs(limit=2)] == ["third", "second"]
+    assert any("idx_runs_created_at" in row[-1] for row in plan)
+
+
+def test_update_fields_rejects_unknown_columns(temp_db: Path) -> None:
+    store = RunStore(temp_db)
+    store.initialize()
+    store.create_run(run_id="abc", input_path=Path("/tmp/foo.csv"), input_filename="foo.csv", source="upload")
+
+    with pytest.raises(ValueError):
+        store._update_fields("abc", **{"status = 'failed', error": "boom"})
+
+
+def test_reads_are_cached_until_next_write(temp_db: Path) -> None:
+    store = RunStore(temp_db)
+    store.initialize()
+    store.create_run(run_id="abc", input_path=Path("/tmp/foo.csv"), input_filename="foo.csv", source="upload")
+
+    first = store.get_run("abc")
+    assert store.get_run("abc") is first
+    assert [run.id for run in store.list_runs()] == ["abc"]
+
+    store.mark_running("abc")
+    store.create_run(run_id="def", input_path=Path("/tmp/bar.csv"), input_filename="bar.csv", source="upload")
+
+    assert store.get_run("abc").status == RunStatus.RUNNING
+    assert {run.id for run in store.list_runs()} == {"abc", "def"}
+
+
+def test_list_runs_summary_returns_ui_columns(temp_db: Path) -> None:
+    store = RunStore(temp_db)
+    store.initialize()
+    store.create_run(run_id="abc", input_path=Path("/tmp/foo.csv"), input_filename="foo.csv", source="upload")
+
+    summaries = store.list_runs_summary()
+
+    assert summaries == [
+        {
+            "id": "abc",
+            "status": "queued",
+            "source": "upload",
+            "input_filename": "foo.csv",
+            "archive_path": None,
+            "log_path": None,
+            "error": None,
+            "created_at": summaries[0]["created_at"],
+            "updated_at": summaries[0]["created_at"],
+        }
+    ]
+    assert store.list_runs_summary() is summaries
+
+
+def test_create_runs_inserts_batch_atomically(temp_db: Path) -> None:
+    store = RunStore(temp_db)
+    store.initialize()
+    store.create_run(run_id="dup", input_path=Path("/tmp/foo.csv"), input_filename="foo.csv", source="upload")
+
+    store.create_runs(
+        [
+            {"run_id": "one", "input_path": Path("/tmp/a.csv"), "input_filename": "a.csv", "source": "schedule"},
+            {"run_id": "two", "input_path": Path("/tmp/b.csv"), "input_filename": "b.csv", "source": "schedule"},
+        ]
+    )
+    with pytest.raises(sqlite3.IntegrityError):
+        store.create_runs(
+            [
+                {"run_id": "three", "input_path": Path("/tmp/c.csv"), "input_filename": "c.csv", "source": "schedule"},
+                {"run_id": "dup", "input_path": Path("/tmp/d.csv"), "input_filename": "d.csv", "source": "schedule"},
+            ]
+        )
+
+    assert {run.id for run in store.list_runs()} == {"dup", "one", "two"}
+    assert store.get_run("one").status == RunStatus.QUEUED
+
+
+def test_reads_during_create_runs_never_see_uncommitted_rows(temp_db: Path) -> None:
+    store = RunStore(temp_db)
+    store.initialize()
+    real_conn = store._conn
+
+    class ReadDuringInsert:
+        """Lets a reader run between the insert and the failure, as a concurrent request could."""
+
+        def execute(self, *args):
+            return real_conn.execute(*args)
+
+        def executemany(self, sql, params):
+            real_conn.executemany(sql, params[:1])
+            assert list(store.list_runs()) == []  # the inserted row is not committed yet
+            raise sqlite3.IntegrityError("simulated failure")
+
+    store._conn = ReadDuringInsert()
+    runs = [
+        {"run_id": run_id, "input_path": Path("/tmp/in.csv"), "input_filename": "in.csv", "source": "upload"}
+        for run_id in ("a", "b")
+    ]
+    with pytest.raises(sqlite3.IntegrityError):
+        store.create_runs(runs)
+    store._conn = real_conn
+
+    assert list(store.list_runs()) == []
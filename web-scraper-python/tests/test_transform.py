@@ -0,0 +1,47 @@
+from scraper.models import RawProductData
+from scraper.transform import product_handle, raw_to_shopify
+
+
+def _raw(**overrides) -> RawProductData:
+    values = dict(
+        source_url="https://shop.example.com/product/1",
+        title="Hydra Cream",
+        sku="SKU1",
+        price=20.0,
+        sale_price=15.0,
+        description_html="<p>Body</p>",
+        main_image="images/main.jpg",
+        gallery_images=["images/g1.jpg", "images/g2.jpg"],
+        detail_images=["images/d1.jpg"],
+    )
+    values.update(overrides)
+    return RawProductData(**values)
+
+
+def test_raw_to_shopify_maps_prices_images_and_body():
+    record = raw_to_shopify(_raw())
+
+    assert record.handle == "hydra-cream"
+    assert record.variants[0].price == 15.0
+    assert record.variants[0].compare_at_price == 20.0
+    assert [(image.src, image.position, image.alt_text) for image in record.images] == [
+        ("images/main.jpg", 1, "Hydra Cream"),
+        ("images/g1.jpg", 2, "Hydra Cream"),
+        ("images/g2.jpg", 3, "Hydra Cream"),
+    ]
+    assert record.body_html == '<p>Body</p><p><img src="images/d1.jpg" alt="Hydra Cream" /></p>'
+
+
+def test_raw_to_shopify_uses_given_handle():
+    record = raw_to_shopify(_raw(title=None, sku=None), handle="precomputed")
+
+    assert record.handle == "precomputed"
+    assert record.variants[0].sku == "precomputed"
+    assert record.title == "Untitled Product"
+    assert 'alt="precomputed"' in record.body_html
+
+
+def test_product_handle_falls_back_to_sku_then_url():
+    assert product_handle(_raw()) == "hydra-cream"
+    assert product_handle(_raw(title=None)) == "sku1"
+    assert product_handle(_raw(title=None, sku=None)) == "https-shop-example-com-product-1"
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+
+def test_save_upload_streams_to_destination(app_module, tmp_path: Path) -> None:
+    payload = b"url\n" + b"https://example.com/product\n" * 1000
+    destination = tmp_path / "upload.csv"
+
+    app_module._save_upload(io.BytesIO(payload), destination, max_bytes=len(payload), chunk_size=64)
+
+    assert destination.read_bytes() == payload
+
+
+def test_save_upload_rejects_oversized_file(app_module, tmp_path: Path) -> None:
+    destination = tmp_path / "upload.csv"
+
+    with pytest.raises(ValueError):
+        app_module._save_upload(io.BytesIO(b"x" * 1024), destination, max_bytes=100, chunk_size=64)
+
+    assert not destination.exists()
+
+
+def test_save_upload_copies_spooled_file_from_disk(app_module, tmp_path: Path) -> None:
+    import tempfile
+
+    payload = b"url\n" + b"https://example.com/product\n" * 100
+    destination = tmp_path / "upload.csv"
+
+    with tempfile.SpooledTemporaryFile(max_size=16) as spooled:
+        spooled.write(payload)
+        app_module._save_upload(spooled, destination, max_bytes=len(payload))
+
+    assert destination.read_bytes() == payload
@@ -19,3 +19,8 @@ def test_split_tags_from_iterable():
 
 def test_split_tags_none_returns_empty():
     assert split_tags(None) == []
+
+
+def test_slugify_collapses_separator_runs():
+    assert slugify("  Hydra -- Cream, 50ml!  ") == "hydra-cream-50ml"
+    assert slugify("설화수 Cream") == "cream"